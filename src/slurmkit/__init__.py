@@ -12,18 +12,38 @@ A toolkit for managing SLURM job workflows including:
 from slurmkit._version import __version__
 __author__ = "Awni Altabaa"
 
-from slurmkit.config import Config, get_config
-from slurmkit.collections import Collection, CollectionManager
-from slurmkit.slurm import (
-    get_canonical_sacct_states,
-    get_job_status,
-    get_sacct_info,
-    get_pending_jobs,
-    submit_job,
-    find_job_output,
-    resolve_job_output_path,
-)
-from slurmkit.generate import JobGenerator
+# Public names resolve lazily so that importing a submodule (e.g. the CLI)
+# does not pay for the whole package tree.
+_LAZY_EXPORTS = {
+    "Config": "slurmkit.config",
+    "get_config": "slurmkit.config",
+    "Collection": "slurmkit.collections",
+    "CollectionManager": "slurmkit.collections",
+    "get_canonical_sacct_states": "slurmkit.slurm",
+    "get_job_status": "slurmkit.slurm",
+    "get_sacct_info": "slurmkit.slurm",
+    "get_pending_jobs": "slurmkit.slurm",
+    "submit_job": "slurmkit.slurm",
+    "find_job_output": "slurmkit.slurm",
+    "resolve_job_output_path": "slurmkit.slurm",
+    "JobGenerator": "slurmkit.generate",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Version
@@ -1,6 +1,18 @@
 """CLI package exports."""
 
-from slurmkit.cli.app import app
 from slurmkit.cli.main import main
 
 __all__ = ["app", "main"]
+
+
+def __getattr__(name):
+    # ``app`` registers every command group; load it only when asked for so the
+    # entry point can answer ``--version`` without building the CLI.
+    if name == "app":
+        from slurmkit.cli.app import app
+
+        # Importing the submodule binds ``slurmkit.cli.app`` to the module;
+        # rebind the name to the Typer app as the eager import used to.
+        globals()["app"] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import click
 import typer
 
-from slurmkit import __version__
+from slurmkit._version import __version__
 
 from .commands_collections import register as register_collections
 from .commands_config import register as register_config
@@ -31,6 +33,12 @@ register_notify(app)
 register_maintenance(app)
 
 
+@lru_cache(maxsize=1)
+def get_click_command() -> click.Command:
+    """Return the Click command tree for ``app``, built once per process."""
+    return typer.main.get_command(app)
+
+
 def _version_callback(value: bool) -> None:
     if value:
         typer.echo(__version__)
@@ -118,7 +126,7 @@ def _home_impl(ctx: typer.Context) -> int:
         "clean_outputs": ["clean", "outputs"],
         "clean_wandb": ["clean", "wandb"],
     }
-    result = app(
+    result = get_click_command()(
         args=command_args[selected],
         prog_name="slurmkit",
         standalone_mode=False,
@@ -23,7 +23,7 @@ from .rendering import (
     render_collection_list,
     render_collection_show,
 )
-from .runtime import can_prompt, get_state
+from .runtime import CLIState, can_prompt, get_state, supports_interaction
 from slurmkit.workflows.collections import (
     analyze_collection,
     delete_collection,
@@ -68,6 +68,18 @@ def _collections_home_impl(ctx: typer.Context) -> int:
     return int(result or 0)
 
 
+def _resolve_show_row_limit(state: CLIState, limit: Optional[int]) -> Optional[int]:
+    if limit is not None:
+        return limit or None
+    if not supports_interaction():
+        return None
+    try:
+        configured = int(state.config.get("ui.collections_show.max_rows", 200))
+    except (TypeError, ValueError):
+        return None
+    return configured if configured > 0 else None
+
+
 def register(app: typer.Typer) -> None:
     app.add_typer(collections_app, name="collections")
 
@@ -102,6 +114,12 @@ def show_command(
     ctx: typer.Context,
     name: Optional[str] = typer.Argument(None, help="Collection name."),
     state_filter: str = typer.Option("all", "--state", help="Filter by normalized job state."),
+    limit: Optional[int] = typer.Option(
+        None,
+        "--limit",
+        min=0,
+        help="Maximum job rows in the table (0 shows all). Defaults to ui.collections_show.max_rows on interactive terminals.",
+    ),
     json_mode: bool = typer.Option(False, "--json", help="Emit JSON output."),
 ) -> None:
     state = get_state(ctx)
@@ -124,6 +142,7 @@ def show_command(
         include_jobs_table=True,
         include_jobs_in_payload=True,
         jobs_table_columns=state.config.get("ui.columns.collections_show"),
+        jobs_table_max_rows=None if json_mode else _resolve_show_row_limit(state, limit),
     )
     if json_mode:
         print_json(rendered.payload)
@@ -214,7 +233,7 @@ def cancel_command(
     )
     collection = manager.load(resolved)
     collection.refresh_states()
-    manager.save(collection)
+    manager.save_if_dirty(collection)
     plan = plan_cancel_collection(collection=collection)
     print_review(plan.review)
     if not dry_run and not yes and can_prompt(state):
@@ -8,7 +8,6 @@ from typing import Optional
 import typer
 
 from slurmkit.collections import CollectionManager
-from slurmkit.generate import render_job_spec_template
 
 from .helpers import resolve_collection_name, resolve_spec_path, resolve_target_collection_for_generate
 from .prompts import canceled, prompt_confirm
@@ -53,6 +52,8 @@ def register(app: typer.Typer) -> None:
             raise typer.BadParameter(
                 f"Output file already exists: {destination}. Use --force to overwrite."
             )
+        from slurmkit.generate import render_job_spec_template
+
         destination.parent.mkdir(parents=True, exist_ok=True)
         destination.write_text(
             render_job_spec_template(config=state.config),
@@ -242,7 +243,7 @@ def register(app: typer.Typer) -> None:
             )
         except ResubmitFilterError as exc:
             raise typer.BadParameter(str(exc), param_hint="--filter") from exc
-        manager.save(target)
+        manager.save_if_dirty(target)
         print_review(plan.review)
         for warning in plan.warnings:
             typer.echo(f"Warning: {warning}", err=True)
@@ -9,13 +9,6 @@ from typing import Optional
 import typer
 
 from slurmkit.collections import CollectionManager
-from slurmkit.workflows.maintenance import (
-    clean_wandb_runs,
-    execute_clean_collection_outputs,
-    plan_clean_collection_outputs,
-    sync_collections,
-)
-from slurmkit.workflows.migration import run_migration
 
 from .helpers import resolve_collection_name
 from .prompts import canceled, prompt_confirm
@@ -67,6 +60,8 @@ def register(app: typer.Typer) -> None:
                 normalized_collection_names = [manager.normalize_name(name) for name in collection]
             except ValueError as exc:
                 raise typer.BadParameter(str(exc), param_hint="--collection") from exc
+        from slurmkit.workflows.maintenance import sync_collections
+
         result = sync_collections(
             config=state.config,
             collection_names=normalized_collection_names,
@@ -82,6 +77,8 @@ def register(app: typer.Typer) -> None:
 
     @app.command("migrate")
     def migrate_command(ctx: typer.Context) -> None:
+        from slurmkit.workflows.migration import run_migration
+
         state = get_state(ctx)
         result = run_migration(
             project_root=state.config.project_root,
@@ -131,6 +128,11 @@ def clean_outputs_command(
         collection,
         prompt_title="Select a collection to clean",
     )
+    from slurmkit.workflows.maintenance import (
+        execute_clean_collection_outputs,
+        plan_clean_collection_outputs,
+    )
+
     target = manager.load(resolved)
     plan = plan_clean_collection_outputs(
         config=state.config,
@@ -164,6 +166,8 @@ def clean_wandb_command(
     resolved_projects = list(projects or (state.config.get("wandb.default_projects", []) or []))
     if not resolved_projects:
         raise typer.BadParameter("No projects specified. Use --project or set wandb.default_projects in config.")
+    from slurmkit.workflows.maintenance import clean_wandb_runs
+
     result = clean_wandb_runs(
         config=state.config,
         projects=resolved_projects,
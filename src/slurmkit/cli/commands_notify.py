@@ -7,12 +7,6 @@ from typing import Optional
 import typer
 
 from slurmkit.collections import CollectionManager
-from slurmkit.notifications import NotificationService
-from slurmkit.workflows.notifications import (
-    run_collection_final_notification,
-    run_job_notification,
-    run_test_notification,
-)
 
 from .runtime import get_state
 
@@ -50,6 +44,10 @@ def notify_job_command(
 ) -> None:
     state = get_state(ctx)
     manager = CollectionManager(config=state.config)
+    # Deferred: the notification stack pulls in requests/smtplib.
+    from slurmkit.notifications import NotificationService
+    from slurmkit.workflows.notifications import run_job_notification
+
     service = NotificationService(config=state.config)
     result = run_job_notification(
         service=service,
@@ -75,6 +73,9 @@ def notify_test_command(
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview without sending."),
 ) -> None:
     state = get_state(ctx)
+    from slurmkit.notifications import NotificationService
+    from slurmkit.workflows.notifications import run_test_notification
+
     service = NotificationService(config=state.config)
     result = run_test_notification(
         service=service,
@@ -101,6 +102,9 @@ def notify_collection_final_command(
 ) -> None:
     state = get_state(ctx)
     manager = CollectionManager(config=state.config)
+    from slurmkit.notifications import NotificationService
+    from slurmkit.workflows.notifications import run_collection_final_notification
+
     service = NotificationService(config=state.config)
     result = run_collection_final_notification(
         service=service,
@@ -9,7 +9,6 @@ from typing import Any, Optional
 import typer
 
 from slurmkit.collections import CollectionManager
-from slurmkit.generate import load_job_spec
 
 from .prompts import canceled, pick_collection, pick_or_create_collection, pick_spec_file
 from .runtime import CLIState, can_prompt, exit_with_error
@@ -62,6 +61,8 @@ def resolve_target_collection_for_generate(
     into: Optional[str],
     spec_path: Path,
 ) -> tuple[str, dict[str, Any]]:
+    from slurmkit.generate import load_job_spec
+
     spec_data = load_job_spec(spec_path)
     if into is not None:
         try:
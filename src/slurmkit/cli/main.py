@@ -5,13 +5,20 @@ from __future__ import annotations
 from typing import List, Optional
 import sys
 
-import typer
-
-from slurmkit.cli.app import app
-
 
 def main(argv: Optional[List[str]] = None) -> int:
     """Run the slurmkit CLI and return an exit code."""
+    args = sys.argv[1:] if argv is None else argv
+    if list(args) == ["--version"]:
+        from slurmkit._version import __version__
+
+        print(__version__)
+        return 0
+
+    import typer
+
+    from slurmkit.cli.app import app
+
     try:
         result = app(
             args=argv,
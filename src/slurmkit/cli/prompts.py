@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -431,7 +432,21 @@ def discover_job_scripts(jobs_dir: Path) -> list[Path]:
     """Return all job scripts under the jobs root."""
     if not jobs_dir.exists():
         return []
-    return sorted(path for path in jobs_dir.rglob("*.job") if path.is_file())
+    # Walk with os.scandir so directory entries reuse cached d_type info and
+    # only matching names are turned into Path objects.
+    script_paths: list[str] = []
+    pending = [str(jobs_dir)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".job") and entry.is_file():
+                        script_paths.append(entry.path)
+        except OSError:
+            continue
+    return sorted(Path(path) for path in script_paths)
 
 
 def pick_job_scripts(jobs_dir: Path) -> list[Path] | None:
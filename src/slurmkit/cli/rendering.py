@@ -5,6 +5,7 @@ from __future__ import annotations
 import io
 import json
 import shutil
+import sys
 from contextlib import redirect_stdout
 from typing import Any, Optional, Sequence
 
@@ -39,7 +40,10 @@ def print_review(review: ReviewPlan) -> None:
 
 
 def print_json(data: Any) -> None:
-    typer.echo(json.dumps(data, indent=2, default=str))
+    # Encode straight into stdout so large payloads (e.g. `collections show
+    # --json` on big collections) never exist as one giant string.
+    json.dump(data, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")
 
 
 def _resolve_collection_show_pager_mode(*, config: Any, report: Any, enable_pager: bool) -> str:
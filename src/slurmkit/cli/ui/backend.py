@@ -2,33 +2,54 @@
 
 from __future__ import annotations
 
-from typing import Protocol, Sequence, Tuple
+import abc
+from functools import lru_cache
+from typing import TYPE_CHECKING, Sequence, Tuple
 
-from slurmkit.cli.ui.context import UI_MODE_PLAIN, UI_MODE_RICH, UIContext
-from slurmkit.cli.ui.models import MetricItem
+from slurmkit.cli.ui.context import UI_MODE_PLAIN, UI_MODE_RICH
 
+if TYPE_CHECKING:
+    from slurmkit.cli.ui.context import UIContext
+    from slurmkit.cli.ui.models import MetricItem, TableSection
 
-class UIBackend(Protocol):
+
+class UIBackend(abc.ABC):
     """Rendering API shared by plain and rich backends."""
 
+    __slots__ = ()
+
+    def __enter__(self) -> "UIBackend":
+        """Start a render pass; backends may buffer output until exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Finish a render pass and flush any buffered output."""
+
+    @abc.abstractmethod
     def heading(self, text: str) -> None:
         """Render a top-level heading."""
 
+    @abc.abstractmethod
     def kv_block(self, rows: Sequence[Tuple[str, str]]) -> None:
         """Render a key-value block."""
 
+    @abc.abstractmethod
     def section(self, title: str) -> None:
         """Render a section header."""
 
+    @abc.abstractmethod
     def text(self, text: str = "") -> None:
         """Render a line of text."""
 
+    @abc.abstractmethod
     def divider(self) -> None:
         """Render a section divider."""
 
+    @abc.abstractmethod
     def metrics(self, title: str, metrics: Sequence[MetricItem]) -> None:
         """Render summary metrics."""
 
+    @abc.abstractmethod
     def table(
         self,
         title: str,
@@ -39,21 +60,45 @@ class UIBackend(Protocol):
     ) -> None:
         """Render a titled table."""
 
+    def render_table_section(self, section: TableSection) -> None:
+        """Render a report table section."""
+        self.table(
+            section.title,
+            section.headers,
+            section.rows,
+            section.status_columns,
+            section.empty_message,
+        )
+
+    @abc.abstractmethod
     def notes(self, lines: Sequence[str], title: str = "Notes:") -> None:
         """Render notes list."""
 
+    @abc.abstractmethod
     def style_status(self, value: str) -> str:
         """Apply status style to a state label."""
 
 
-def create_ui_backend(ctx: UIContext) -> UIBackend:
-    """Create UI backend for the resolved mode."""
-    if ctx.effective_mode == UI_MODE_RICH:
+@lru_cache(maxsize=2)
+def _backend_class(mode: str) -> type:
+    if mode == UI_MODE_RICH:
         from slurmkit.cli.ui.rich_backend import RichBackend
 
-        return RichBackend()
-    if ctx.effective_mode == UI_MODE_PLAIN:
-        from slurmkit.cli.ui.plain import PlainBackend
+        return RichBackend
+    from slurmkit.cli.ui.plain import PlainBackend
+
+    return PlainBackend
+
 
-        return PlainBackend(enable_color=ctx.plain_color_enabled)
-    raise ValueError(f"Unsupported UI mode: {ctx.effective_mode}")
+def create_ui_backend(ctx: UIContext) -> UIBackend:
+    """Create a fresh UI backend for the resolved mode.
+
+    Only the backend class lookup is cached; instances carry output-buffer
+    state and are therefore never shared between callers.
+    """
+    if ctx.effective_mode not in (UI_MODE_RICH, UI_MODE_PLAIN):
+        raise ValueError(f"Unsupported UI mode: {ctx.effective_mode}")
+    backend_cls = _backend_class(ctx.effective_mode)
+    if ctx.effective_mode == UI_MODE_RICH:
+        return backend_cls()
+    return backend_cls(enable_color=ctx.plain_color_enabled)
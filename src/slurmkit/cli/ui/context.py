@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import importlib.util
 import os
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional
 
 from slurmkit.config import Config
@@ -41,16 +43,14 @@ def _normalize_mode(value: Optional[str], default: str) -> str:
     return default
 
 
+@lru_cache(maxsize=1)
 def _is_rich_available() -> bool:
-    try:
-        import rich  # noqa: F401
-
-        return True
-    except ImportError:
-        return False
+    # Probe without importing rich; plain mode should never pay for it.
+    return importlib.util.find_spec("rich") is not None
 
 
 def _stdout_isatty() -> bool:
+    # Not cached: sys.stdout can be swapped (pagers, test runners).
     return bool(getattr(sys.stdout, "isatty", lambda: False)())
 
 
@@ -9,7 +9,7 @@ from typing import List, Optional, Sequence, Tuple
 KeyValueList = Sequence[Tuple[str, str]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricItem:
     """A summary metric with optional percentage and semantic state."""
 
@@ -20,7 +20,7 @@ class MetricItem:
     details: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TableSection:
     """A titled table section."""
 
@@ -31,7 +31,7 @@ class TableSection:
     empty_message: str = "  (no rows)"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CollectionShowReport:
     """View model for `collection show` table output."""
 
@@ -42,7 +42,7 @@ class CollectionShowReport:
     jobs_table: Optional[TableSection]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CollectionListReport:
     """View model for `collections list` table output."""
 
@@ -50,7 +50,7 @@ class CollectionListReport:
     table: TableSection
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CollectionAnalyzeReport:
     """View model for `collection analyze` table output."""
 
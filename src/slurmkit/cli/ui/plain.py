@@ -2,16 +2,109 @@
 
 from __future__ import annotations
 
-from typing import Sequence, Tuple
+import re
+import sys
+from typing import Optional, Sequence, Tuple
 
 from tabulate import tabulate
 
+from slurmkit.cli.ui.backend import UIBackend
 from slurmkit.cli.ui.models import MetricItem
 
 
-class PlainBackend:
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_INT_RE = re.compile(r"-?[0-9]+")
+_NUMERIC_CHARS = frozenset("0123456789,.+-")
+
+
+def _simple_cell_kind(cell: object) -> Optional[str]:
+    """Classify a cell as tabulate would: "int", "str", "" (missing), or None if unsure."""
+    if not isinstance(cell, str) or "\n" in cell or "\t" in cell or cell != cell.strip():
+        # tabulate expands tabs before measuring widths; leave those to it.
+        return None
+    visible = _ANSI_RE.sub("", cell) if "\x1b" in cell else cell
+    if not visible:
+        return ""
+    if not visible.isascii():
+        return None
+    if _INT_RE.fullmatch(visible):
+        # tabulate reformats colored integers; leave those to it.
+        return "int" if visible is cell else None
+    if visible in ("True", "False") or set(visible) <= _NUMERIC_CHARS:
+        return None
+    try:
+        float(visible)
+    except ValueError:
+        return "str"
+    return None
+
+
+def _render_simple_table(
+    headers: Sequence[str],
+    rows: Sequence[Sequence[str]],
+) -> Optional[str]:
+    """Render ``tablefmt="simple"`` output in one pass over the cells.
+
+    Matches tabulate for string and integer cells, which is what the report
+    builders produce. Returns None for anything else so the caller can fall
+    back to tabulate.
+    """
+    ncols = len(headers)
+    widths = []
+    for header in headers:
+        if _simple_cell_kind(header) not in ("str", "int", "") or "\x1b" in header:
+            return None
+        widths.append(len(header) + 2)
+    has_int = [False] * ncols
+    has_str = [False] * ncols
+    visible_rows = []
+    for row in rows:
+        if len(row) != ncols:
+            return None
+        visible_lengths = []
+        for idx, cell in enumerate(row):
+            kind = _simple_cell_kind(cell)
+            if kind is None:
+                return None
+            if kind == "str":
+                has_str[idx] = True
+            elif kind == "int":
+                has_int[idx] = True
+            length = len(_ANSI_RE.sub("", cell)) if "\x1b" in cell else len(cell)
+            if length > widths[idx]:
+                widths[idx] = length
+            visible_lengths.append(length)
+        visible_rows.append((row, visible_lengths))
+
+    right = [has_int[idx] and not has_str[idx] for idx in range(ncols)]
+    lines = [
+        "  ".join(
+            header.rjust(width) if align_right else header.ljust(width)
+            for header, width, align_right in zip(headers, widths, right)
+        ).rstrip(),
+        "  ".join("-" * width for width in widths),
+    ]
+    for row, visible_lengths in visible_rows:
+        cells = []
+        for cell, length, width, align_right in zip(row, visible_lengths, widths, right):
+            padding = " " * (width - length)
+            cells.append(padding + cell if align_right else cell + padding)
+        lines.append("  ".join(cells).rstrip())
+    return "\n".join(lines)
+
+
+def _format_simple_table(headers: Sequence[str], rows: Sequence[Sequence[str]]) -> str:
+    rendered = _render_simple_table(headers, rows)
+    if rendered is None:
+        rendered = tabulate(rows, headers=headers, tablefmt="simple")
+    return rendered
+
+
+class PlainBackend(UIBackend):
     """Plain text renderer with improved formatting."""
 
+    __slots__ = ("enable_color", "width", "_divider", "_buffer", "_depth", "_styled")
+
     _STATUS_STYLES = {
         "completed": "\033[32m",
         "failed": "\033[31m",
@@ -25,27 +118,55 @@ class PlainBackend:
     def __init__(self, enable_color: bool = False, width: int = 80):
         self.enable_color = enable_color
         self.width = width
+        self._divider = "-" * width
+        self._buffer: Optional[list[str]] = None
+        # Nesting depth of ``with backend:`` blocks; only the outermost flushes.
+        self._depth = 0
+        # Styled form of each status label seen so far; tables repeat a few states.
+        self._styled: dict[str, str] = {}
+
+    def __enter__(self) -> "PlainBackend":
+        if self._depth == 0:
+            self._buffer = []
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        lines, self._buffer = self._buffer, None
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+    def _emit(self, line: str = "") -> None:
+        if self._buffer is None:
+            print(line)
+        else:
+            self._buffer.append(line)
 
     def heading(self, text: str) -> None:
-        print(text)
+        self._emit(text)
         self.divider()
 
     def kv_block(self, rows: Sequence[Tuple[str, str]]) -> None:
         if not rows:
             return
-        label_width = max(len(label) for label, _ in rows)
-        for label, value in rows:
-            print(f"{label:<{label_width}}  {value}")
+        label_width = 0
+        for label, _ in rows:
+            if len(label) > label_width:
+                label_width = len(label)
+        self._emit("\n".join(f"{label:<{label_width}}  {value}" for label, value in rows))
 
     def section(self, title: str) -> None:
-        print()
-        print(title)
+        self._emit()
+        self._emit(title)
 
     def text(self, text: str = "") -> None:
-        print(text)
+        self._emit(text)
 
     def divider(self) -> None:
-        print("-" * self.width)
+        self._emit(self._divider)
 
     def metrics(self, title: str, metrics: Sequence[MetricItem]) -> None:
         self.section(title)
@@ -54,11 +175,11 @@ class PlainBackend:
             if item.state:
                 label = self.style_status(label)
             if item.percent is None:
-                print(f"  {label}: {item.value}")
+                self._emit(f"  {label}: {item.value}")
             else:
-                print(f"  {label}: {item.value} ({item.percent:.1f}%)")
+                self._emit(f"  {label}: {item.value} ({item.percent:.1f}%)")
             if item.details:
-                print(f"    {item.details}")
+                self._emit(f"    {item.details}")
 
     def table(
         self,
@@ -71,7 +192,12 @@ class PlainBackend:
         self.section(title)
         self.divider()
         if not rows:
-            print(empty_message)
+            self._emit(empty_message)
+            return
+
+        if not (self.enable_color and status_columns):
+            # Nothing to restyle, so render the rows without a copy.
+            self._emit(_format_simple_table(headers, rows))
             return
 
         rendered_rows = []
@@ -81,19 +207,21 @@ class PlainBackend:
                 if 0 <= idx < len(rendered):
                     rendered[idx] = self.style_status(rendered[idx])
             rendered_rows.append(rendered)
-        print(tabulate(rendered_rows, headers=headers, tablefmt="simple"))
+        self._emit(_format_simple_table(headers, rendered_rows))
 
     def notes(self, lines: Sequence[str], title: str = "Notes:") -> None:
         if not lines:
             return
         self.section(title)
         for line in lines:
-            print(f"  - {line}")
+            self._emit(f"  - {line}")
 
     def style_status(self, value: str) -> str:
         if not self.enable_color:
             return value
-        style = self._STATUS_STYLES.get(value.strip().lower())
-        if not style:
-            return value
-        return f"{style}{value}{self._RESET}"
+        styled = self._styled.get(value)
+        if styled is None:
+            style = self._STATUS_STYLES.get(value.strip().lower())
+            styled = f"{style}{value}{self._RESET}" if style else value
+            self._styled[value] = styled
+        return styled
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 
 from slurmkit.cli.ui.backend import UIBackend
 from slurmkit.cli.ui.models import (
@@ -28,8 +29,21 @@ DEFAULT_COLLECTION_SHOW_COLUMNS: tuple[str, ...] = (
 )
 
 
+_MISSING_VALUE_TOKENS = frozenset({"N/A", "NONE", "NULL"})
+
+# (summary key, metric label, status style key) for the show summary block.
+_SHOW_SUMMARY_METRICS = (
+    ("completed", "Completed", "completed"),
+    ("failed", "Failed", "failed"),
+    ("running", "Running", "running"),
+    ("pending", "Pending", "pending"),
+    ("not_submitted", "Not Submitted", "not submitted"),
+)
+_ANALYZE_SUMMARY_STATES = ("completed", "failed", "running", "pending", "unknown")
+
+
 def _format_pct(value: float) -> str:
-    return f"{value * 100.0:.1f}"
+    return "%.1f" % (value * 100.0)
 
 
 def _has_submitted_job_id(job_id: Any) -> bool:
@@ -38,7 +52,7 @@ def _has_submitted_job_id(job_id: Any) -> bool:
     value = str(job_id).strip()
     if not value:
         return False
-    return value.upper() not in {"N/A", "NONE", "NULL"}
+    return value.upper() not in _MISSING_VALUE_TOKENS
 
 
 def _to_non_negative_int(value: Any) -> int:
@@ -56,7 +70,7 @@ def _normalize_raw_state(value: Any) -> Optional[str]:
     if not raw_state:
         return None
     raw_state_upper = raw_state.upper()
-    if raw_state_upper in {"N/A", "NONE", "NULL"}:
+    if raw_state_upper in _MISSING_VALUE_TOKENS:
         return None
     return raw_state_upper
 
@@ -192,6 +206,7 @@ def _normalize_path_value(value: Any) -> str:
 _COLUMN_DEF = Tuple[str, Callable[[Dict[str, Any], datetime], str], bool]
 
 
+@lru_cache(maxsize=1)
 def _collection_show_column_registry() -> Dict[str, _COLUMN_DEF]:
     return {
         "job_name": ("Job Name", lambda job, _now: _string_or_empty(job.get("job_name", "")), False),
@@ -232,20 +247,27 @@ def _build_collection_show_jobs_table(
     *,
     columns: Optional[Sequence[str]],
     now_utc: datetime,
+    max_rows: Optional[int] = None,
 ) -> TableSection:
     registry = _collection_show_column_registry()
     resolved_columns = _resolve_collection_show_columns(columns)
+    title = f"Jobs ({len(jobs)}):"
+    if max_rows is not None and 0 < max_rows < len(jobs):
+        title = (
+            f"Jobs ({len(jobs)}, showing first {max_rows}; "
+            "use --limit 0 or --json for all):"
+        )
+        jobs = jobs[:max_rows]
 
     headers = [registry[column_id][0] for column_id in resolved_columns]
     status_columns = tuple(
         idx for idx, column_id in enumerate(resolved_columns) if registry[column_id][2]
     )
-    rows: list[list[str]] = []
-    for job in jobs:
-        rows.append([registry[column_id][1](job, now_utc) for column_id in resolved_columns])
+    extractors = tuple(registry[column_id][1] for column_id in resolved_columns)
+    rows = [tuple(extract(job, now_utc) for extract in extractors) for job in jobs]
 
     return TableSection(
-        title=f"Jobs ({len(jobs)}):",
+        title=title,
         headers=headers,
         rows=rows,
         status_columns=status_columns,
@@ -263,6 +285,7 @@ def build_collection_show_report(
     summary_jobs: Optional[Sequence[Dict[str, Any]]] = None,
     include_jobs_table: bool = True,
     jobs_table_columns: Optional[Sequence[str]] = None,
+    jobs_table_max_rows: Optional[int] = None,
     metadata_links: Optional[Sequence[Tuple[str, str]]] = None,
     runtime_now: Optional[datetime] = None,
     estimated_completion_at: Optional[str] = None,
@@ -275,12 +298,23 @@ def build_collection_show_report(
     summary_source_jobs = summary_jobs if summary_jobs is not None else jobs
     total = max(summary.get("total", 0), 1)
     primary_jobs_count = len(summary_source_jobs)
-    submitted_primary_count = sum(
-        1 for job in summary_source_jobs if _has_submitted_job_id(job.get("primary_job_id"))
-    )
-    resubmitted_jobs_count = sum(
-        _to_non_negative_int(job.get("resubmissions_count", 0)) for job in summary_source_jobs
-    )
+
+    # One pass over the summary jobs for submission counts and raw-state details.
+    submitted_primary_count = 0
+    resubmitted_jobs_count = 0
+    raw_state_breakdowns: Dict[str, Dict[str, int]] = {}
+    for job in summary_source_jobs:
+        if _has_submitted_job_id(job.get("primary_job_id")):
+            submitted_primary_count += 1
+        resubmitted_jobs_count += _to_non_negative_int(job.get("resubmissions_count", 0))
+        normalized_state = str(job.get("effective_state", "")).strip().lower()
+        if not normalized_state:
+            continue
+        raw_state = _normalize_raw_state(job.get("effective_state_raw"))
+        if raw_state is None:
+            continue
+        breakdown = raw_state_breakdowns.setdefault(normalized_state, {})
+        breakdown[raw_state] = breakdown.get(raw_state, 0) + 1
     submitted_slurm_jobs_count = submitted_primary_count + resubmitted_jobs_count
 
     metadata = [
@@ -308,19 +342,8 @@ def build_collection_show_report(
         if value:
             metadata.append((label, value))
 
-    raw_state_breakdowns: Dict[str, Dict[str, int]] = {}
-    for job in summary_source_jobs:
-        normalized_state = str(job.get("effective_state", "")).strip().lower()
-        if not normalized_state:
-            continue
-        raw_state = _normalize_raw_state(job.get("effective_state_raw"))
-        if raw_state is None:
-            continue
-        breakdown = raw_state_breakdowns.setdefault(normalized_state, {})
-        breakdown[raw_state] = breakdown.get(raw_state, 0) + 1
-
     summary_metrics = []
-    for key in ("completed", "failed", "running", "pending", "not_submitted"):
+    for key, label, state in _SHOW_SUMMARY_METRICS:
         count = int(summary.get(key, 0))
         details = None
         breakdown = raw_state_breakdowns.get(key)
@@ -334,10 +357,10 @@ def build_collection_show_report(
             )
         summary_metrics.append(
             MetricItem(
-                label=key.replace("_", " ").title(),
+                label=label,
                 value=str(count),
                 percent=(count * 100.0 / total),
-                state=key.replace("_", " "),
+                state=state,
                 details=details,
             )
         )
@@ -348,6 +371,7 @@ def build_collection_show_report(
             jobs,
             columns=jobs_table_columns,
             now_utc=now_utc,
+            max_rows=jobs_table_max_rows,
         )
 
     return CollectionShowReport(
@@ -431,102 +455,109 @@ def build_collection_analyze_report(
     if selected_params:
         metadata_lines.append(f"Selected params: {', '.join(selected_params)}")
 
-    overall_metrics = []
-    for state in ["completed", "failed", "running", "pending", "unknown"]:
-        overall_metrics.append(
-            MetricItem(
-                label=state,
-                value=str(counts[state]),
-                percent=rates[state] * 100.0,
-                state=state,
-            )
+    overall_metrics = [
+        MetricItem(
+            label=state,
+            value=str(counts[state]),
+            percent=rates[state] * 100.0,
+            state=state,
         )
+        for state in _ANALYZE_SUMMARY_STATES
+    ]
 
+    overall_title = f"Overall summary ({summary['total_jobs']} jobs):"
+    title = f"Collection Analysis: {collection_name}"
     info_messages: List[str] = []
+    if not parameters:
+        info_messages.append("No analyzable parameters found.")
+        if skipped:
+            info_messages.append(f"Skipped requested params: {', '.join(skipped)}")
+        return CollectionAnalyzeReport(
+            title=title,
+            metadata_lines=metadata_lines,
+            overall_title=overall_title,
+            overall_metrics=overall_metrics,
+            info_messages=info_messages,
+            parameter_tables=[],
+            top_risky_table=None,
+            top_stable_table=None,
+            notes=[],
+        )
+
     parameter_tables: List[TableSection] = []
     top_risky_table: Optional[TableSection] = None
     top_stable_table: Optional[TableSection] = None
     notes: List[str] = [f"Low N marks groups with n < min_support ({min_support})."]
 
-    if not parameters:
-        info_messages.append("No analyzable parameters found.")
+    varying_parameters = [p for p in parameters if len(p.get("values", [])) >= 2]
+    varying_param_names = {p["param"] for p in varying_parameters}
+
+    if not varying_parameters:
+        info_messages.append(
+            "No parameter breakdown shown: all analyzed parameters have only one distinct value."
+        )
         if skipped:
             info_messages.append(f"Skipped requested params: {', '.join(skipped)}")
     else:
-        varying_parameters = [p for p in parameters if len(p.get("values", [])) >= 2]
-        varying_param_names = {p["param"] for p in varying_parameters}
-
-        if not varying_parameters:
-            info_messages.append(
-                "No parameter breakdown shown: all analyzed parameters have only one distinct value."
-            )
-            if skipped:
-                info_messages.append(f"Skipped requested params: {', '.join(skipped)}")
-        else:
-            for param_block in varying_parameters:
-                rows = []
-                for value_entry in param_block["values"]:
-                    c = value_entry["counts"]
-                    r = value_entry["rates"]
-                    rows.append(
-                        [
-                            str(value_entry["value"]),
-                            str(value_entry["n"]),
-                            str(c["failed"]),
-                            str(c["completed"]),
-                            str(c["running"]),
-                            str(c["pending"]),
-                            str(c["unknown"]),
-                            _format_pct(r["failure_rate"]),
-                            _format_pct(r["completion_rate"]),
-                            "yes" if value_entry["low_sample"] else "",
-                        ]
-                    )
-
-                parameter_tables.append(
-                    TableSection(
-                        title=f"Parameter: {param_block['param']}",
-                        headers=[
-                            "Value",
-                            "N",
-                            "Failed",
-                            "Completed",
-                            "Running",
-                            "Pending",
-                            "Unknown",
-                            "Fail %",
-                            "Complete %",
-                            "Low N",
-                        ],
-                        rows=rows,
-                    )
+        for param_block in varying_parameters:
+            rows = []
+            for value_entry in param_block["values"]:
+                c = value_entry["counts"]
+                r = value_entry["rates"]
+                rows.append(
+                    [
+                        str(value_entry["value"]),
+                        str(value_entry["n"]),
+                        str(c["failed"]),
+                        str(c["completed"]),
+                        str(c["running"]),
+                        str(c["pending"]),
+                        str(c["unknown"]),
+                        _format_pct(r["failure_rate"]),
+                        _format_pct(r["completion_rate"]),
+                        "yes" if value_entry["low_sample"] else "",
+                    ]
                 )
 
-            top_risky_display = [
-                e for e in analysis["top_risky_values"] if e["param"] in varying_param_names
-            ]
-            top_stable_display = [
-                e for e in analysis["top_stable_values"] if e["param"] in varying_param_names
-            ]
-
-            top_risky_table = _build_top_values_table(
-                "Top risky values:",
-                top_risky_display,
-                "failure_rate",
-            )
-            top_stable_table = _build_top_values_table(
-                "Top stable values:",
-                top_stable_display,
-                "completion_rate",
+            parameter_tables.append(
+                TableSection(
+                    title=f"Parameter: {param_block['param']}",
+                    headers=[
+                        "Value",
+                        "N",
+                        "Failed",
+                        "Completed",
+                        "Running",
+                        "Pending",
+                        "Unknown",
+                        "Fail %",
+                        "Complete %",
+                        "Low N",
+                    ],
+                    rows=rows,
+                )
             )
 
-            if skipped:
-                notes.append(f"Skipped requested params not found: {', '.join(skipped)}")
+        top_risky_table = _build_top_values_table(
+            "Top risky values:",
+            analysis["top_risky_values"],
+            "failure_rate",
+            allowed_params=varying_param_names,
+        )
+        top_stable_table = _build_top_values_table(
+            "Top stable values:",
+            analysis["top_stable_values"],
+            "completion_rate",
+            allowed_params=varying_param_names,
+        )
+
+        if skipped:
+            notes.append(f"Skipped requested params not found: {', '.join(skipped)}")
 
     return CollectionAnalyzeReport(
-        title=f"Collection Analysis: {collection_name}",
+        title=title,
         metadata_lines=metadata_lines,
-        overall_title=f"Overall summary ({summary['total_jobs']} jobs):",
+        overall_title=overall_title,
         overall_metrics=overall_metrics,
         info_messages=info_messages,
         parameter_tables=parameter_tables,
@@ -540,9 +571,12 @@ def _build_top_values_table(
     title: str,
     entries: Sequence[Dict[str, Any]],
     rate_key: str,
+    allowed_params: Optional[Set[str]] = None,
 ) -> TableSection:
     rows = []
     for entry in entries:
+        if allowed_params is not None and entry["param"] not in allowed_params:
+            continue
         rows.append(
             [
                 str(entry["param"]),
@@ -563,66 +597,39 @@ def _build_top_values_table(
 
 def render_collection_show_report(report: CollectionShowReport, backend: UIBackend) -> None:
     """Render collection show report with selected backend."""
-    backend.heading(report.title)
-    backend.kv_block(report.metadata)
-    backend.metrics(report.summary_title, report.summary_metrics)
-    if report.jobs_table is not None:
-        backend.table(
-            title=report.jobs_table.title,
-            headers=report.jobs_table.headers,
-            rows=report.jobs_table.rows,
-            status_columns=report.jobs_table.status_columns,
-            empty_message=report.jobs_table.empty_message,
-        )
+    with backend:
+        backend.heading(report.title)
+        backend.kv_block(report.metadata)
+        backend.metrics(report.summary_title, report.summary_metrics)
+        if report.jobs_table is not None:
+            backend.render_table_section(report.jobs_table)
 
 
 def render_collection_list_report(report: CollectionListReport, backend: UIBackend) -> None:
     """Render collection list report with selected backend."""
-    backend.heading(report.title)
-    backend.table(
-        title=report.table.title,
-        headers=report.table.headers,
-        rows=report.table.rows,
-        status_columns=report.table.status_columns,
-        empty_message=report.table.empty_message,
-    )
+    with backend:
+        backend.heading(report.title)
+        backend.render_table_section(report.table)
 
 
 def render_collection_analyze_report(report: CollectionAnalyzeReport, backend: UIBackend) -> None:
     """Render collection analyze report with selected backend."""
-    backend.heading(report.title)
-    for line in report.metadata_lines:
-        backend.text(f"  {line}")
-    backend.divider()
-    backend.metrics(report.overall_title, report.overall_metrics)
-
-    for message in report.info_messages:
-        backend.section(message if message.endswith(".") else f"{message}")
-
-    for table in report.parameter_tables:
-        backend.table(
-            title=table.title,
-            headers=table.headers,
-            rows=table.rows,
-            status_columns=table.status_columns,
-            empty_message=table.empty_message,
-        )
-
-    if report.parameter_tables:
-        if report.top_risky_table:
-            backend.table(
-                title=report.top_risky_table.title,
-                headers=report.top_risky_table.headers,
-                rows=report.top_risky_table.rows,
-                status_columns=report.top_risky_table.status_columns,
-                empty_message=report.top_risky_table.empty_message,
-            )
-        if report.top_stable_table:
-            backend.table(
-                title=report.top_stable_table.title,
-                headers=report.top_stable_table.headers,
-                rows=report.top_stable_table.rows,
-                status_columns=report.top_stable_table.status_columns,
-                empty_message=report.top_stable_table.empty_message,
-            )
-        backend.notes(report.notes)
+    with backend:
+        backend.heading(report.title)
+        for line in report.metadata_lines:
+            backend.text(f"  {line}")
+        backend.divider()
+        backend.metrics(report.overall_title, report.overall_metrics)
+
+        for message in report.info_messages:
+            backend.section(message if message.endswith(".") else f"{message}")
+
+        for table in report.parameter_tables:
+            backend.render_table_section(table)
+
+        if report.parameter_tables:
+            if report.top_risky_table:
+                backend.render_table_section(report.top_risky_table)
+            if report.top_stable_table:
+                backend.render_table_section(report.top_stable_table)
+            backend.notes(report.notes)
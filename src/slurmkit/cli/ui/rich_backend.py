@@ -10,12 +10,15 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from slurmkit.cli.ui.backend import UIBackend
 from slurmkit.cli.ui.models import MetricItem
 
 
-class RichBackend:
+class RichBackend(UIBackend):
     """Rich renderer for interactive terminals."""
 
+    __slots__ = ("console",)
+
     _STATUS_STYLES = {
         "completed": "bold green",
         "failed": "bold red",
@@ -89,6 +92,7 @@ class RichBackend:
         output_path_indexes = {
             idx for idx, header in enumerate(headers) if str(header).strip().lower() == "output path"
         }
+        status_indexes = frozenset(status_columns)
 
         for row in rows:
             rendered = []
@@ -96,7 +100,7 @@ class RichBackend:
                 text: str | Text = value
                 if idx in output_path_indexes:
                     text = self._render_output_link(value)
-                if idx in status_columns:
+                if idx in status_indexes:
                     text = self.style_status(value)
                 rendered.append(text)
             table.add_row(*rendered)
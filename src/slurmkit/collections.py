@@ -10,6 +10,7 @@ resubmissions.
 from __future__ import annotations
 
 import fcntl
+import heapq
 import json
 import os
 import re
@@ -17,13 +18,14 @@ import socket
 import stat
 import subprocess
 import tempfile
+import time
 from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
 
 import yaml
 
@@ -39,11 +41,67 @@ JOB_STATE_COMPLETED = "completed"
 JOB_STATE_FAILED = "failed"
 JOB_STATE_UNKNOWN = "unknown"
 
+# Raw SLURM state -> normalized state; anything else is unknown.
+_NORMALIZED_STATES: Dict[str, str] = {
+    "PENDING": JOB_STATE_PENDING,
+    "REQUEUED": JOB_STATE_PENDING,
+    "SUSPENDED": JOB_STATE_PENDING,
+    "RUNNING": JOB_STATE_RUNNING,
+    "COMPLETING": JOB_STATE_RUNNING,
+    "COMPLETED": JOB_STATE_COMPLETED,
+    "FAILED": JOB_STATE_FAILED,
+    "CANCELLED": JOB_STATE_FAILED,
+    "TIMEOUT": JOB_STATE_FAILED,
+    "NODE_FAIL": JOB_STATE_FAILED,
+    "PREEMPTED": JOB_STATE_FAILED,
+    "OUT_OF_MEMORY": JOB_STATE_FAILED,
+}
+
+# Count order used by analyze_status_by_params; counts are tallied in
+# fixed-size lists indexed by position and turned back into dicts on output.
+_ANALYSIS_STATES = (
+    JOB_STATE_COMPLETED,
+    JOB_STATE_FAILED,
+    JOB_STATE_RUNNING,
+    JOB_STATE_PENDING,
+    JOB_STATE_UNKNOWN,
+)
+_ANALYSIS_STATE_INDEX = {state: index for index, state in enumerate(_ANALYSIS_STATES)}
+
+
+@lru_cache(maxsize=64)
+def _normalize_job_state(state: Optional[str]) -> str:
+    # Pure and called per job/row; the set of raw states seen is tiny.
+    if state is None:
+        return JOB_STATE_UNKNOWN
+    return _NORMALIZED_STATES.get(str(state).upper(), JOB_STATE_UNKNOWN)
+
+
 _COLLECTION_SEGMENT_RE = re.compile(r"^[A-Za-z0-9._-]+$")
 
+# Use the libyaml-backed loader/dumper when PyYAML was built with it; they
+# produce the same documents several times faster than the pure-Python ones.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
+
+# (epoch second, formatted) of the last _now_iso() call. Timestamps only carry
+# second precision, so bulk adds within one second reuse the formatted string.
+_last_now_iso: tuple[int, str] = (-1, "")
+
 
 def _now_iso() -> str:
-    return datetime.now().isoformat(timespec="seconds")
+    global _last_now_iso
+    second = int(time.time())
+    if _last_now_iso[0] != second:
+        _last_now_iso = (second, datetime.fromtimestamp(second).isoformat(timespec="seconds"))
+    return _last_now_iso[1]
+
+
+@lru_cache(maxsize=1)
+def _local_hostname() -> str:
+    # Defaults for every new attempt; the hostname does not change mid-run.
+    return socket.gethostname()
 
 
 def _run_git_command(args: List[str]) -> Optional[str]:
@@ -62,14 +120,25 @@ def _run_git_command(args: List[str]) -> Optional[str]:
     return value if value else None
 
 
-@lru_cache(maxsize=1)
-def _get_git_metadata() -> Dict[str, Optional[str]]:
+@lru_cache(maxsize=8)
+def _get_git_metadata(cwd: Optional[str] = None) -> Dict[str, Optional[str]]:
+    # ``cwd`` only keys the cache: git runs in the process working directory,
+    # so a chdir into another checkout gets its own entry.
+    # One rev-parse, one line per revision. --abbrev-ref only applies to the
+    # revisions after it, so the full commit id comes first.
+    output = _run_git_command(["rev-parse", "HEAD", "--abbrev-ref", "HEAD"])
+    lines = output.splitlines() if output else []
     return {
-        "git_branch": _run_git_command(["rev-parse", "--abbrev-ref", "HEAD"]),
-        "git_commit_id": _run_git_command(["rev-parse", "HEAD"]),
+        "git_branch": lines[1].strip() or None if len(lines) > 1 else None,
+        "git_commit_id": lines[0].strip() or None if len(lines) > 0 else None,
     }
 
 
+def invalidate_git_metadata() -> None:
+    """Forget cached git branch/commit, e.g. after switching branches in-process."""
+    _get_git_metadata.cache_clear()
+
+
 def _string_or_none(value: Any) -> Optional[str]:
     if value is None:
         return None
@@ -153,7 +222,7 @@ class Collection:
         self.version = version
         self.name = name
         self.description = description
-        self.cluster = cluster or socket.gethostname()
+        self.cluster = cluster or _local_hostname()
         now = _now_iso()
         self.created_at = created_at or now
         self.updated_at = updated_at or now
@@ -164,34 +233,39 @@ class Collection:
             self._normalize_job(job)
             for job in (jobs or [])
         ]
+        self._rebuild_job_index()
+        self._dirty = False
 
     @property
     def jobs(self) -> List[Dict[str, Any]]:
         return self._jobs
 
+    @property
+    def dirty(self) -> bool:
+        """Whether tracked mutations happened since construction or the last save."""
+        return self._dirty
+
     def _touch(self) -> None:
         self.updated_at = _now_iso()
+        self._dirty = True
+
+    def _rebuild_job_index(self) -> None:
+        # Lookups by name/job ID sit inside per-job loops (submit, resubmit,
+        # job ID resolution), so keep hash indexes instead of scanning jobs.
+        # The first matching job wins, mirroring list-order scan semantics.
+        self._jobs_by_name: Dict[str, Dict[str, Any]] = {}
+        self._jobs_by_id: Dict[str, Dict[str, Any]] = {}
+        for job in self._jobs:
+            self._index_job(job)
 
-    def _normalize_state(self, state: Optional[str]) -> str:
-        if state is None:
-            return JOB_STATE_UNKNOWN
-        state_upper = str(state).upper()
-        if state_upper in ("PENDING", "REQUEUED", "SUSPENDED"):
-            return JOB_STATE_PENDING
-        if state_upper in ("RUNNING", "COMPLETING"):
-            return JOB_STATE_RUNNING
-        if state_upper == "COMPLETED":
-            return JOB_STATE_COMPLETED
-        if state_upper in (
-            "FAILED",
-            "CANCELLED",
-            "TIMEOUT",
-            "NODE_FAIL",
-            "PREEMPTED",
-            "OUT_OF_MEMORY",
-        ):
-            return JOB_STATE_FAILED
-        return JOB_STATE_UNKNOWN
+    def _index_job(self, job: Dict[str, Any]) -> None:
+        self._jobs_by_name.setdefault(job["job_name"], job)
+        for attempt in job["attempts"]:
+            job_id = attempt.get("job_id")
+            if job_id is not None:
+                self._jobs_by_id.setdefault(job_id, job)
+
+    _normalize_state = staticmethod(_normalize_job_state)
 
     def _new_attempt(
         self,
@@ -212,13 +286,13 @@ class Collection:
         regenerated: Optional[bool] = None,
         raw_state: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
-        git_metadata = _get_git_metadata()
+        git_metadata = _get_git_metadata(os.getcwd())
         return {
             "kind": kind,
             "job_id": _string_or_none(job_id),
             # Canonical operational state used by all filtering/summaries.
             "state": _string_or_none(state),
-            "hostname": _string_or_none(hostname) or socket.gethostname(),
+            "hostname": _string_or_none(hostname) or _local_hostname(),
             "submitted_at": _string_or_none(submitted_at),
             "started_at": _string_or_none(started_at),
             "completed_at": _string_or_none(completed_at),
@@ -322,21 +396,15 @@ class Collection:
             ],
         }
         self._jobs.append(job)
+        self._index_job(job)
         self._touch()
         return job
 
     def get_job(self, job_name: str) -> Optional[Dict[str, Any]]:
-        for job in self._jobs:
-            if job["job_name"] == job_name:
-                return job
-        return None
+        return self._jobs_by_name.get(job_name)
 
     def get_job_by_id(self, job_id: str) -> Optional[Dict[str, Any]]:
-        for job in self._jobs:
-            for attempt in job.get("attempts", []):
-                if attempt.get("job_id") == job_id:
-                    return job
-        return None
+        return self._jobs_by_id.get(job_id)
 
     def update_job(
         self,
@@ -354,7 +422,12 @@ class Collection:
             return False
         attempt = self.primary_attempt(job)
         if job_id is not None:
+            previous_job_id = attempt.get("job_id")
             attempt["job_id"] = _string_or_none(job_id)
+            if previous_job_id is not None and previous_job_id != attempt["job_id"]:
+                self._rebuild_job_index()
+            elif attempt["job_id"] is not None:
+                self._jobs_by_id.setdefault(attempt["job_id"], job)
         if state is not None:
             attempt["state"] = _string_or_none(state)
         if output_path is not None:
@@ -400,16 +473,28 @@ class Collection:
             regenerated=regenerated,
         )
         job["attempts"].append(attempt)
+        if attempt["job_id"] is not None:
+            self._jobs_by_id.setdefault(attempt["job_id"], job)
         self._touch()
         return True
 
     def remove_job(self, job_name: str) -> bool:
-        for index, job in enumerate(self._jobs):
-            if job["job_name"] == job_name:
-                del self._jobs[index]
-                self._touch()
-                return True
-        return False
+        return self.remove_jobs([job_name]) == 1
+
+    def remove_jobs(self, job_names: Iterable[str]) -> int:
+        """Remove the first job with each given name; return how many were removed."""
+        # Rebuild the list and indexes once rather than once per removed job.
+        targets = {
+            id(self._jobs_by_name[job_name])
+            for job_name in job_names
+            if job_name in self._jobs_by_name
+        }
+        if not targets:
+            return 0
+        self._jobs = [job for job in self._jobs if id(job) not in targets]
+        self._rebuild_job_index()
+        self._touch()
+        return len(targets)
 
     def filter_jobs(
         self,
@@ -417,16 +502,20 @@ class Collection:
         hostname: Optional[str] = None,
         submitted: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
+        if submitted is None and hostname is None and state is None:
+            return list(self._jobs)
+        normalize_state = _normalize_job_state
         result = []
         for job in self._jobs:
-            primary = self.primary_attempt(job)
+            # Only the primary attempt is consulted; read it directly.
+            primary = job["attempts"][0]
             if submitted is not None:
                 is_submitted = primary.get("job_id") is not None
                 if submitted != is_submitted:
                     continue
             if hostname is not None and primary.get("hostname") != hostname:
                 continue
-            if state is not None and self._normalize_state(primary.get("state")) != state:
+            if state is not None and normalize_state(primary.get("state")) != state:
                 continue
             result.append(job)
         return result
@@ -562,12 +651,8 @@ class Collection:
         attempt_mode: str = "primary",
         submission_group: Optional[str] = None,
     ) -> Dict[str, int]:
-        rows = self.get_effective_jobs(
-            attempt_mode=attempt_mode,
-            submission_group=submission_group,
-        )
         summary = {
-            "total": len(rows),
+            "total": 0,
             "pending": 0,
             "running": 0,
             "completed": 0,
@@ -575,11 +660,23 @@ class Collection:
             "unknown": 0,
             "not_submitted": 0,
         }
-        for row in rows:
-            if row.get("effective_job_id") is None:
+        # Count straight from the effective attempts; building full
+        # get_effective_jobs() rows (history strings, parameter copies) only
+        # to tally two fields dominated summary cost for large collections.
+        for job in self._jobs:
+            resolved = self._effective_attempt_for_job(
+                job,
+                attempt_mode=attempt_mode,
+                submission_group=submission_group,
+            )
+            if resolved is None:
+                continue
+            summary["total"] += 1
+            effective = resolved["attempt"]
+            if effective.get("job_id") is None:
                 summary["not_submitted"] += 1
                 continue
-            state = row.get("effective_state", JOB_STATE_UNKNOWN)
+            state = self._normalize_state(effective.get("state"))
             summary[state] = summary.get(state, 0) + 1
         return summary
 
@@ -693,40 +790,46 @@ class Collection:
 
         parameter_results = []
         all_value_entries = []
-        for param in params_to_analyze:
-            grouped: Dict[str, Dict[str, Any]] = {}
-            for row in rows:
-                params = row.get("parameters", {})
-                if param not in params:
+        # Group every analyzed parameter in one pass over the rows; each
+        # parameter's values keep first-seen row order.
+        grouped_by_param: Dict[str, Dict[str, List[int]]] = {
+            param: {} for param in params_to_analyze
+        }
+        # JSON keys for dict/list values, by object identity; rows outlive this
+        # loop, so ids stay valid and values shared across jobs dump once.
+        container_keys: Dict[int, str] = {}
+        for row in rows:
+            state_index = _ANALYSIS_STATE_INDEX[row["state"]]
+            for param, raw_value in row.get("parameters", {}).items():
+                grouped = grouped_by_param.get(param)
+                if grouped is None:
                     continue
-                value_key = self._format_param_value(params[param])
-                if value_key not in grouped:
-                    grouped[value_key] = {
-                        "value": value_key,
-                        "n": 0,
-                        "counts": {
-                            JOB_STATE_COMPLETED: 0,
-                            JOB_STATE_FAILED: 0,
-                            JOB_STATE_RUNNING: 0,
-                            JOB_STATE_PENDING: 0,
-                            JOB_STATE_UNKNOWN: 0,
-                        },
-                    }
-                grouped[value_key]["n"] += 1
-                grouped[value_key]["counts"][row["state"]] += 1
+                if isinstance(raw_value, (dict, list, tuple)):
+                    value_key = container_keys.get(id(raw_value))
+                    if value_key is None:
+                        value_key = container_keys[id(raw_value)] = self._format_param_value(raw_value)
+                else:
+                    value_key = str(raw_value)
+                state_counts = grouped.get(value_key)
+                if state_counts is None:
+                    state_counts = grouped[value_key] = [0] * len(_ANALYSIS_STATES)
+                state_counts[state_index] += 1
 
+        for param in params_to_analyze:
+            grouped = grouped_by_param[param]
             if not grouped:
                 continue
 
             values = []
-            for value_key, data in grouped.items():
-                count = data["n"]
-                failure_rate = data["counts"][JOB_STATE_FAILED] / count
-                completion_rate = data["counts"][JOB_STATE_COMPLETED] / count
+            for value_key, state_counts in grouped.items():
+                count = sum(state_counts)
+                counts = dict(zip(_ANALYSIS_STATES, state_counts))
+                failure_rate = counts[JOB_STATE_FAILED] / count
+                completion_rate = counts[JOB_STATE_COMPLETED] / count
                 entry = {
                     "value": value_key,
                     "n": count,
-                    "counts": data["counts"],
+                    "counts": counts,
                     "rates": {
                         "failure_rate": failure_rate,
                         "completion_rate": completion_rate,
@@ -740,14 +843,17 @@ class Collection:
             parameter_results.append({"param": param, "values": values})
 
         eligible = [entry for entry in all_value_entries if entry["n"] >= min_support]
-        top_risky = sorted(
+        # nsmallest(k, ...) equals sorted(...)[:k] without sorting every entry.
+        top_risky = heapq.nsmallest(
+            top_k,
             eligible,
             key=lambda item: (-item["rates"]["failure_rate"], -item["n"], item["param"], item["value"]),
-        )[:top_k]
-        top_stable = sorted(
+        )
+        top_stable = heapq.nsmallest(
+            top_k,
             eligible,
             key=lambda item: (-item["rates"]["completion_rate"], -item["n"], item["param"], item["value"]),
-        )[:top_k]
+        )
 
         return {
             "summary": {
@@ -767,70 +873,80 @@ class Collection:
             },
         }
 
-    def refresh_states(self) -> int:
-        job_ids = [
-            str(attempt["job_id"])
+    def _tracked_attempts(self) -> List[tuple[Dict[str, Any], Dict[str, Any], str]]:
+        return [
+            (job, attempt, str(attempt["job_id"]))
             for job in self._jobs
             for attempt in job.get("attempts", [])
             if attempt.get("job_id")
         ]
-        if not job_ids:
+
+    def tracked_job_ids(self) -> List[str]:
+        """Return the SLURM job ID of every submitted attempt."""
+        return [job_id_text for _, _, job_id_text in self._tracked_attempts()]
+
+    def refresh_states(self, info_map: Optional[Dict[str, Dict[str, Any]]] = None) -> int:
+        """Refresh attempt states from sacct.
+
+        ``info_map`` takes precomputed ``get_canonical_sacct_states`` results
+        so callers refreshing several collections can query sacct once.
+        """
+        # Collect submitted attempts once; the update pass reuses this list
+        # instead of walking every job and attempt a second time.
+        tracked = self._tracked_attempts()
+        if not tracked:
             return 0
 
-        # Refresh uses canonical state inference from full sacct rows, not the
-        # legacy parent-only sacct view.
-        info_map = get_canonical_sacct_states(job_ids)
+        if info_map is None:
+            # Refresh uses canonical state inference from full sacct rows, not
+            # the legacy parent-only sacct view.
+            info_map = get_canonical_sacct_states([job_id_text for _, _, job_id_text in tracked])
         updated = 0
         changed = False
         config = get_config()
         jobs_dir = config.get_path("jobs_dir")
-        for job in self._jobs:
-            for attempt in job["attempts"]:
-                job_id = attempt.get("job_id")
-                if not job_id:
-                    continue
-                job_id_text = str(job_id)
-                if not attempt.get("output_path") and attempt.get("script_path"):
-                    output_path = resolve_job_output_path(
-                        attempt["script_path"],
-                        job_id_text,
-                        job_name=attempt.get("job_name") or job.get("job_name"),
-                        jobs_dir=jobs_dir,
-                        config=config,
-                    )
-                    if output_path is not None:
-                        attempt["output_path"] = str(output_path)
-                        changed = True
-                if job_id_text not in info_map:
-                    continue
-                info = info_map[job_id_text]
-                new_state = info.get("state")
-                if attempt.get("state") != new_state:
-                    attempt["state"] = new_state
-                    updated += 1
-                    changed = True
-                # Persist row-level diagnostics alongside canonical state to
-                # support debugging without affecting state-based behavior.
-                raw_state = info.get("raw_state")
-                if attempt.get("raw_state") != raw_state:
-                    attempt["raw_state"] = raw_state
-                    changed = True
-                # Start/end come from the canonical resolver's selected/fallback
-                # row ordering, rather than directly trusting the parent row.
-                if (
-                    info.get("start")
-                    and info["start"] != "Unknown"
-                    and attempt.get("started_at") != info["start"]
-                ):
-                    attempt["started_at"] = info["start"]
-                    changed = True
-                if (
-                    info.get("end")
-                    and info["end"] != "Unknown"
-                    and attempt.get("completed_at") != info["end"]
-                ):
-                    attempt["completed_at"] = info["end"]
+        for job, attempt, job_id_text in tracked:
+            if not attempt.get("output_path") and attempt.get("script_path"):
+                output_path = resolve_job_output_path(
+                    attempt["script_path"],
+                    job_id_text,
+                    job_name=attempt.get("job_name") or job.get("job_name"),
+                    jobs_dir=jobs_dir,
+                    config=config,
+                )
+                if output_path is not None:
+                    attempt["output_path"] = str(output_path)
                     changed = True
+            info = info_map.get(job_id_text)
+            if info is None:
+                continue
+            new_state = info.get("state")
+            if attempt.get("state") != new_state:
+                attempt["state"] = new_state
+                updated += 1
+                changed = True
+            # Persist row-level diagnostics alongside canonical state to
+            # support debugging without affecting state-based behavior.
+            raw_state = info.get("raw_state")
+            if attempt.get("raw_state") != raw_state:
+                attempt["raw_state"] = raw_state
+                changed = True
+            # Start/end come from the canonical resolver's selected/fallback
+            # row ordering, rather than directly trusting the parent row.
+            if (
+                info.get("start")
+                and info["start"] != "Unknown"
+                and attempt.get("started_at") != info["start"]
+            ):
+                attempt["started_at"] = info["start"]
+                changed = True
+            if (
+                info.get("end")
+                and info["end"] != "Unknown"
+                and attempt.get("completed_at") != info["end"]
+            ):
+                attempt["completed_at"] = info["end"]
+                changed = True
 
         if changed:
             self._touch()
@@ -919,6 +1035,12 @@ class CollectionManager:
             self.collection_locks_dir = config.collection_locks_dir
         else:
             self.collection_locks_dir = self.collections_dir.parent / "locks" / "collections"
+        # Parsed YAML per collection file, keyed by a (mtime_ns, size, inode)
+        # stamp so edits and atomic replaces from other processes invalidate it.
+        self._parsed_cache: Dict[Path, tuple[tuple[int, int, int], Dict[str, Any]]] = {}
+        # Tracked job IDs per collection, paired with the parsed data they were
+        # read from; a re-parse yields a new data object and a rebuilt entry.
+        self._job_id_index: Dict[str, tuple[Dict[str, Any], frozenset]] = {}
 
     def _ensure_dir(self) -> None:
         self.collections_dir.mkdir(parents=True, exist_ok=True)
@@ -965,14 +1087,35 @@ class CollectionManager:
             finally:
                 os.close(fd)
 
-    def load(self, name: str) -> Collection:
-        canonical_name = self.normalize_name(name)
+    def _read_collection_data(self, canonical_name: str) -> Dict[str, Any]:
         path = self.get_collection_path(canonical_name)
-        if not path.exists():
-            raise FileNotFoundError(f"Collection not found: {canonical_name}")
+        try:
+            file_stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Collection not found: {canonical_name}") from None
+        stamp = (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+        cached = self._parsed_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
         with open(path, "r", encoding="utf-8") as handle:
-            data = yaml.safe_load(handle) or {}
-        collection = Collection.from_dict(data)
+            data = yaml.load(handle, Loader=_YAML_SAFE_LOADER) or {}
+        self._parsed_cache[path] = (stamp, data)
+        return data
+
+    def load(self, name: str) -> Collection:
+        canonical_name = self.normalize_name(name)
+        data = self._read_collection_data(canonical_name)
+        # Collections share nested values with the data they are built from,
+        # so hand each caller its own copy of the cached parse.
+        collection = Collection.from_dict(deepcopy(data))
+        collection.name = canonical_name
+        return collection
+
+    def _load_read_only(self, name: str) -> Collection:
+        # Skips the defensive copy in load(); the result shares nested values
+        # with the parse cache, so callers must not mutate it.
+        canonical_name = self.normalize_name(name)
+        collection = Collection.from_dict(self._read_collection_data(canonical_name))
         collection.name = canonical_name
         return collection
 
@@ -984,8 +1127,16 @@ class CollectionManager:
 
         with self._collection_lock(collection.name):
             self._atomic_write_collection(path, collection)
+        self._parsed_cache.pop(path, None)
+        collection._dirty = False
         return path
 
+    def save_if_dirty(self, collection: Collection) -> Optional[Path]:
+        """Save a collection only when it has unsaved tracked mutations."""
+        if not collection.dirty:
+            return None
+        return self.save(collection)
+
     def _atomic_write_collection(self, path: Path, collection: Collection) -> None:
         mode = stat.S_IMODE(path.stat().st_mode) if path.exists() else 0o644
         fd: Optional[int] = None
@@ -1003,6 +1154,7 @@ class CollectionManager:
                 yaml.dump(
                     collection.to_dict(),
                     handle,
+                    Dumper=_YAML_DUMPER,
                     default_flow_style=False,
                     sort_keys=False,
                     allow_unicode=True,
@@ -1071,6 +1223,7 @@ class CollectionManager:
 
     def delete(self, name: str) -> bool:
         path = self.get_collection_path(name)
+        self._parsed_cache.pop(path, None)
         if path.exists():
             path.unlink()
             self._prune_empty_parent_dirs(path.parent)
@@ -1107,7 +1260,7 @@ class CollectionManager:
         if collection_name is not None:
             names = [collection_name]
         else:
-            names = self.list_collections()
+            names = self.find_collections_by_job_id(normalized_job_id, warnings)
 
         for name in names:
             if collection_name is not None and not self.exists(name):
@@ -1131,11 +1284,48 @@ class CollectionManager:
 
         return JobIdResolution(job_id=normalized_job_id, matches=matches, warnings=warnings)
 
+    def find_collections_by_job_id(
+        self,
+        job_id: str,
+        warnings: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Return names of collections with any attempt tracking ``job_id``.
+
+        Collections that fail to load are skipped, with a message appended to
+        ``warnings`` when given.
+        """
+        names: List[str] = []
+        for name in self.list_collections():
+            try:
+                data = self._read_collection_data(name)
+                cached = self._job_id_index.get(name)
+                if cached is None or cached[0] is not data:
+                    job_ids = frozenset(self._load_read_only(name)._jobs_by_id)
+                    cached = self._job_id_index[name] = (data, job_ids)
+            except Exception as exc:
+                if warnings is not None:
+                    warnings.append(f"Failed to load collection '{name}': {exc}")
+                continue
+            if job_id in cached[1]:
+                names.append(name)
+        return names
+
+    def refresh_all(self, collections: List[Collection]) -> List[int]:
+        """Refresh several collections from a single sacct query.
+
+        Returns the number of updated attempts for each collection, in order.
+        """
+        job_ids: Dict[str, None] = {}
+        for collection in collections:
+            job_ids.update(dict.fromkeys(collection.tracked_job_ids()))
+        info_map = get_canonical_sacct_states(list(job_ids)) if job_ids else {}
+        return [collection.refresh_states(info_map=info_map) for collection in collections]
+
     def list_collections_with_summary(self, attempt_mode: str = "primary") -> List[Dict[str, Any]]:
         rows = []
         for name in self.list_collections():
             try:
-                collection = self.load(name)
+                collection = self._load_read_only(name)
             except Exception:
                 continue
             rows.append(
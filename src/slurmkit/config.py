@@ -17,10 +17,10 @@ Environment Variables:
 
 import os
 import socket
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-import yaml
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 # =============================================================================
@@ -38,6 +38,16 @@ JOB_SCRIPTS_SUBDIR = "job_scripts"
 JOB_LOGS_SUBDIR = "logs"
 
 
+@lru_cache(maxsize=1)
+def _yaml() -> ModuleType:
+    # PyYAML is imported on first use: importing this module (directly or via
+    # slurm/notifications helpers) should not pay for it when no config file
+    # is read or written.
+    import yaml
+
+    return yaml
+
+
 DEFAULT_CONFIG = {
     # Directory structure
     "jobs_dir": ".jobs/",
@@ -91,9 +101,13 @@ DEFAULT_CONFIG = {
         },
         "collections_show": {
             "pager": "less",  # less | none
+            "max_rows": 200,  # interactive row cap; 0 renders all rows
         },
     },
 
+    # Persist compiled job templates under $XDG_CACHE_HOME/slurmkit/jinja
+    "jinja_bytecode_cache": True,
+
     # Notifications (webhook transports)
     "notifications": {
         "defaults": {
@@ -135,6 +149,9 @@ ENV_VAR_MAP = {
     "SLURMKIT_DRY_RUN": "dry_run",
 }
 
+# Sentinel distinguishing "key absent" from a stored None in Config.get.
+_MISSING = object()
+
 
 # =============================================================================
 # Configuration Class
@@ -193,6 +210,9 @@ class Config:
 
         # Load configuration
         self._config = self._load_config()
+        # Resolved values by dotted key. The loaded tree is never replaced,
+        # so entries stay valid for the lifetime of this Config.
+        self._get_cache: Dict[str, Any] = {}
 
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -205,9 +225,16 @@ class Config:
         config = _deep_copy(DEFAULT_CONFIG)
 
         # Merge project config file if it exists
-        if self.config_path.exists():
-            with open(self.config_path, "r") as f:
-                file_config = yaml.safe_load(f) or {}
+        try:
+            f = open(self.config_path, "r")
+        except FileNotFoundError:
+            pass
+        else:
+            with f:
+                yaml = _yaml()
+                # Prefer the libyaml-backed loader when PyYAML was built with it.
+                loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                file_config = yaml.load(f, Loader=loader) or {}
             config = _deep_merge(config, file_config)
 
         # Apply environment variable overrides
@@ -259,7 +286,13 @@ class Config:
             >>> config.get("nonexistent", "fallback")
             'fallback'
         """
-        return _get_nested(self._config, key, default)
+        value = self._get_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = _get_nested(self._config, key, _MISSING)
+            if value is _MISSING:
+                return default
+            self._get_cache[key] = value
+        return value
 
     def get_path(self, key: str, default: Any = None) -> Optional[Path]:
         """
@@ -348,7 +381,9 @@ class Config:
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(save_path, "w") as f:
-            yaml.dump(self._config, f, default_flow_style=False, sort_keys=False)
+            yaml = _yaml()
+            dumper = getattr(yaml, "CDumper", yaml.Dumper)
+            yaml.dump(self._config, f, Dumper=dumper, default_flow_style=False, sort_keys=False)
 
         return save_path
 
@@ -439,8 +474,8 @@ def init_config(
         else:
             config_data[key] = value
 
-    # Create directory and write config
-    config_path.parent.mkdir(parents=True, exist_ok=True)
+    # Create directories and write config; the subdirectory mkdirs also
+    # create the metadata directory itself.
     (root / METADATA_DIRNAME / COLLECTIONS_SUBDIR).mkdir(parents=True, exist_ok=True)
     (root / METADATA_DIRNAME / SYNC_SUBDIR).mkdir(parents=True, exist_ok=True)
     (root / METADATA_DIRNAME / LOCKS_SUBDIR / COLLECTION_LOCKS_SUBDIR).mkdir(parents=True, exist_ok=True)
@@ -458,14 +493,24 @@ def _deep_copy(d: Dict[str, Any]) -> Dict[str, Any]:
     """
     Create a deep copy of a dictionary.
 
+    Config trees only hold YAML-native values, so dicts and lists are copied
+    recursively and everything else is treated as immutable.
+
     Args:
         d: Dictionary to copy.
 
     Returns:
         Deep copy of the dictionary.
     """
-    import copy
-    return copy.deepcopy(d)
+    return {key: _copy_value(value) for key, value in d.items()}
+
+
+def _copy_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _copy_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(item) for item in value]
+    return value
 
 
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
@@ -479,19 +524,26 @@ def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any
     Returns:
         Merged dictionary.
     """
+    # Copy once up front, then merge in place; re-copying at every nesting
+    # level would copy deep subtrees repeatedly.
     result = _deep_copy(base)
+    _merge_into(result, override)
+    return result
+
 
+def _merge_into(target: Dict[str, Any], override: Dict[str, Any]) -> None:
     for key, value in override.items():
-        if (
-            key in result
-            and isinstance(result[key], dict)
-            and isinstance(value, dict)
-        ):
-            result[key] = _deep_merge(result[key], value)
+        current = target.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _merge_into(current, value)
         else:
-            result[key] = value
+            target[key] = value
 
-    return result
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    # Config lookups reuse a handful of literal key paths; split each once.
+    return tuple(key.split("."))
 
 
 def _get_nested(d: Dict[str, Any], key: str, default: Any = None) -> Any:
@@ -506,7 +558,7 @@ def _get_nested(d: Dict[str, Any], key: str, default: Any = None) -> Any:
     Returns:
         Value at key path or default.
     """
-    keys = key.split(".")
+    keys = _split_key(key)
     value = d
 
     for k in keys:
@@ -527,7 +579,7 @@ def _set_nested(d: Dict[str, Any], key: str, value: Any) -> None:
         key: Dot-separated key path (e.g., "a.b.c").
         value: Value to set.
     """
-    keys = key.split(".")
+    keys = _split_key(key)
 
     for k in keys[:-1]:
         if k not in d:
@@ -539,6 +591,7 @@ def _set_nested(d: Dict[str, Any], key: str, value: Any) -> None:
 
 def format_config_yaml(data: Dict[str, Any], *, with_comments: bool = False) -> str:
     """Serialize config to YAML, optionally with user-facing comments."""
+    yaml = _yaml()
     if not with_comments:
         return yaml.dump(data, default_flow_style=False, sort_keys=False)
 
@@ -568,6 +621,11 @@ def format_config_yaml(data: Dict[str, Any], *, with_comments: bool = False) ->
         "pager",
         DEFAULT_CONFIG["ui"]["collections_show"]["pager"],
     )
+    max_rows = collections_show_ui.get(
+        "max_rows",
+        DEFAULT_CONFIG["ui"]["collections_show"]["max_rows"],
+    )
+    jinja_bytecode_cache = data.get("jinja_bytecode_cache", DEFAULT_CONFIG["jinja_bytecode_cache"])
     notifications = data.get("notifications", DEFAULT_CONFIG["notifications"])
     wandb = data.get("wandb", DEFAULT_CONFIG["wandb"])
 
@@ -601,6 +659,10 @@ def format_config_yaml(data: Dict[str, Any], *, with_comments: bool = False) ->
         _yaml_block(collections_show_columns, indent=6),
         "  collections_show:",
         f"    pager: {pager_mode}  # less | none",
+        f"    max_rows: {max_rows}  # interactive row cap; 0 renders all rows",
+        "",
+        "# Cache compiled job templates under $XDG_CACHE_HOME/slurmkit/jinja.",
+        f"jinja_bytecode_cache: {str(bool(jinja_bytecode_cache)).lower()}",
         "",
         "# Notification configuration used by `slurmkit notify`.",
         "notifications:",
@@ -13,18 +13,31 @@ from __future__ import annotations
 
 import importlib.util
 import itertools
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 import yaml
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 from slurmkit.config import JOB_LOGS_SUBDIR, JOB_SCRIPTS_SUBDIR, Config, get_config
 from slurmkit.collections import Collection, CollectionManager
 from slurmkit.spec_interpolation import build_job_subdir_context, render_spec_string
 
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Script writes are syscall-bound, so a few threads overlap them with
+# rendering on the main thread.
+GENERATE_WRITE_WORKERS = 4
+
+
 # =============================================================================
 # Parameter Expansion
 # =============================================================================
@@ -56,14 +69,18 @@ def expand_grid(
         yield {}
         return
 
-    keys = list(params.keys())
+    keys = tuple(params.keys())
     values = [params[k] if isinstance(params[k], list) else [params[k]] for k in keys]
 
-    for combo in itertools.product(*values):
-        combo_dict = dict(zip(keys, combo))
-        if filter_func is not None and not filter_func(combo_dict):
-            continue
-        yield combo_dict
+    # Build the combination dicts in C-level map() chains rather than a
+    # Python-level loop body per combination.
+    combos = map(dict, map(zip, itertools.repeat(keys), itertools.product(*values)))
+    if filter_func is None:
+        yield from combos
+        return
+    for combo_dict in combos:
+        if filter_func(combo_dict):
+            yield combo_dict
 
 
 def expand_parameters(
@@ -101,6 +118,28 @@ def expand_parameters(
         >>> expand_parameters(spec)
         [{'lr': 0.01}, {'lr': 0.1}]
     """
+    return list(iter_parameters(spec, filter_func=filter_func, parse_func=parse_func))
+
+
+def iter_parameters(
+    spec: Dict[str, Any],
+    filter_func: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    parse_func: Optional[Callable[[Dict[str, Any]], Union[Dict[str, Any], List[Dict[str, Any]]]]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily expand a parameter specification, one parameter dict at a time.
+
+    Same semantics as ``expand_parameters`` without materializing the full
+    list, so single-pass consumers keep memory flat on large grids.
+
+    Args:
+        spec: Parameter specification with "mode" and "values" keys.
+        filter_func: Optional predicate for grid mode.
+        parse_func: Optional parameter parser callback.
+
+    Yields:
+        Parameter dictionaries in expansion order.
+    """
     mode = spec.get("mode", "grid")
     values = spec.get("values", {})
 
@@ -122,10 +161,8 @@ def expand_parameters(
 
     if mode == "list":
         param_list = values if isinstance(values, list) else [values]
-        expanded = []
         for params in param_list:
-            expanded.extend(normalize_param_parse_output(params, parse_func))
-        return expanded
+            yield from normalize_param_parse_output(params, parse_func)
 
     elif mode == "grid":
         if filter_func is None:
@@ -143,19 +180,33 @@ def expand_parameters(
                         parsed_filter["file"],
                         parsed_filter["function"],
                     )
-        expanded = []
         for params in expand_grid(values):
             parsed_params = normalize_param_parse_output(params, parse_func)
             for effective_params in parsed_params:
                 if filter_func is not None and not filter_func(effective_params):
                     continue
-                expanded.append(effective_params)
-        return expanded
+                yield effective_params
 
     else:
         raise ValueError(f"Unknown parameter mode: {mode}. Use 'grid' or 'list'.")
 
 
+def _count_unfiltered_parameters(spec: Dict[str, Any]) -> Optional[int]:
+    """Count expansions without materializing them, or None if unsure."""
+    if not isinstance(spec, dict) or spec.get("parse") is not None:
+        return None
+    mode = spec.get("mode", "grid")
+    values = spec.get("values", {})
+    if mode == "list":
+        return len(values) if isinstance(values, list) else 1
+    if mode == "grid" and isinstance(values, dict) and spec.get("filter") is None:
+        count = 1
+        for value in values.values():
+            count *= len(value) if isinstance(value, list) else 1
+        return count
+    return None
+
+
 # =============================================================================
 # Parameter Parser / Filter Logic
 # =============================================================================
@@ -311,6 +362,35 @@ def resolve_python_file_function_spec(
     }
 
 
+# Executed callback modules keyed by (module name, resolved file path), each
+# stored with the (mtime_ns, size) stamp it was loaded from. Sweeps build many
+# generators from the same spec, so unchanged files are executed only once.
+_CALLBACK_MODULE_CACHE: Dict[Tuple[str, str], Tuple[Tuple[int, int], ModuleType]] = {}
+
+
+def _load_callback_module(file_path: Path, module_name: str) -> ModuleType:
+    """Execute a user callback file as ``module_name``, reusing unchanged loads."""
+    resolved_path = file_path.resolve()
+    file_stat = resolved_path.stat()
+    stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+    cache_key = (module_name, str(resolved_path))
+    cached = _CALLBACK_MODULE_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        module = cached[1]
+        sys.modules[module_name] = module
+        return module
+
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not load module from {file_path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    _CALLBACK_MODULE_CACHE[cache_key] = (stamp, module)
+    return module
+
+
 def load_param_parse_function(
     file_path: Union[str, Path],
     function_name: str = "parse_params",
@@ -326,13 +406,7 @@ def load_param_parse_function(
     if not file_path.exists():
         raise FileNotFoundError(f"Parameter parser file not found: {file_path}")
 
-    spec = importlib.util.spec_from_file_location("param_parse_module", file_path)
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Could not load module from {file_path}")
-
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["param_parse_module"] = module
-    spec.loader.exec_module(module)
+    module = _load_callback_module(file_path, "param_parse_module")
 
     if not hasattr(module, function_name):
         raise AttributeError(
@@ -368,14 +442,7 @@ def load_param_filter_function(
     if not file_path.exists():
         raise FileNotFoundError(f"Parameter filter file not found: {file_path}")
 
-    # Load the module dynamically
-    spec = importlib.util.spec_from_file_location("param_filter_module", file_path)
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Could not load module from {file_path}")
-
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["param_filter_module"] = module
-    spec.loader.exec_module(module)
+    module = _load_callback_module(file_path, "param_filter_module")
 
     # Get the function
     if not hasattr(module, function_name):
@@ -464,14 +531,7 @@ def load_slurm_args_function(
     if not file_path.exists():
         raise FileNotFoundError(f"SLURM args file not found: {file_path}")
 
-    # Load the module dynamically
-    spec = importlib.util.spec_from_file_location("slurm_args_module", file_path)
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Could not load module from {file_path}")
-
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["slurm_args_module"] = module
-    spec.loader.exec_module(module)
+    module = _load_callback_module(file_path, "slurm_args_module")
 
     # Get the function
     if not hasattr(module, function_name):
@@ -490,8 +550,8 @@ def compute_slurm_args(
     """
     Compute SLURM arguments for a job.
 
-    If a logic function is provided, it is called to customize the arguments.
-    Otherwise, defaults are returned unchanged.
+    If a logic function is provided, it is called with a fresh copy of the
+    defaults to customize. Otherwise a copy of the defaults is returned.
 
     Args:
         params: Job parameters.
@@ -504,17 +564,60 @@ def compute_slurm_args(
     if logic_func is None:
         return defaults.copy()
 
-    return logic_func(params, defaults.copy())
+    return logic_func(params, dict(defaults))
+
+
+def _job_info(
+    job_name: str,
+    script_path: Path,
+    params: Dict[str, Any],
+    slurm_args: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Build the job info dict returned by JobGenerator.generate/generate_one."""
+    return {
+        "job_name": job_name,
+        "script_path": script_path,
+        "parameters": params,
+        "slurm_args": slurm_args,
+    }
+
+
+def _write_script(path: Path, content: str) -> None:
+    """Write a job script with raw os-level calls.
+
+    Skips the buffered text-file wrapper (and its extra fstat/isatty
+    syscalls) that ``Path.write_text`` sets up for every generated job.
+    """
+    data = content.encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
 
 # =============================================================================
 # Job Name Generation
 # =============================================================================
 
+# Shared environment for job name patterns compiled without a caller-supplied env.
+_DEFAULT_JINJA_ENV = Environment()
+
+
+@lru_cache(maxsize=128)
+def _compile_name_pattern(pattern: str) -> Template:
+    """Compile a job name pattern once against the default environment."""
+    return _DEFAULT_JINJA_ENV.from_string(pattern)
+
+
 def generate_job_name(
     params: Dict[str, Any],
     pattern: Optional[str] = None,
     env: Optional[Environment] = None,
+    template: Optional[Template] = None,
 ) -> str:
     """
     Generate a job name from parameters.
@@ -524,7 +627,10 @@ def generate_job_name(
     Args:
         params: Job parameters.
         pattern: Jinja2 pattern for job name. If None, uses param values joined by underscores.
-        env: Jinja2 environment. If None, creates a new one.
+        env: Jinja2 environment. If None, uses a shared default environment
+            and reuses the compiled pattern across calls.
+        template: Precompiled pattern template. Takes precedence over ``pattern``
+            so callers naming many jobs compile the pattern once.
 
     Returns:
         Generated job name.
@@ -533,15 +639,18 @@ def generate_job_name(
         >>> generate_job_name({"model": "resnet", "lr": 0.01}, "{{ model }}_lr{{ lr }}")
         'resnet_lr0.01'
     """
+    if template is not None:
+        return template.render(**params)
+
     if pattern is None:
         # Default: join param values with underscores
         parts = [f"{k}{v}" for k, v in sorted(params.items())]
         return "_".join(parts)
 
     if env is None:
-        env = Environment()
-
-    template = env.from_string(pattern)
+        template = _compile_name_pattern(pattern)
+    else:
+        template = env.from_string(pattern)
     return template.render(**params)
 
 
@@ -572,6 +681,11 @@ def make_unique_job_name(job_name: str, existing_names: Iterable[str]) -> str:
 # Job Spec Loading
 # =============================================================================
 
+# Parsed job specs keyed by resolved path, with the (mtime_ns, size) stamp
+# they were parsed from.
+_JOB_SPEC_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
 def load_job_spec(spec_path: Union[str, Path]) -> Dict[str, Any]:
     """
     Load a job specification from a YAML file.
@@ -587,13 +701,22 @@ def load_job_spec(spec_path: Union[str, Path]) -> Dict[str, Any]:
     """
     spec_path = Path(spec_path)
 
-    if not spec_path.exists():
-        raise FileNotFoundError(f"Job spec not found: {spec_path}")
+    try:
+        file_stat = spec_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Job spec not found: {spec_path}") from None
 
-    with open(spec_path, "r") as f:
-        spec = yaml.safe_load(f) or {}
+    # One generate command reads the same spec several times (target
+    # resolution, planning, JobGenerator.from_spec); parse it once per change.
+    cache_key = str(spec_path.resolve())
+    stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _JOB_SPEC_CACHE.get(cache_key)
+    if cached is None or cached[0] != stamp:
+        with open(spec_path, "r") as f:
+            spec = yaml.load(f, Loader=_YAML_SAFE_LOADER) or {}
+        cached = _JOB_SPEC_CACHE[cache_key] = (stamp, spec)
 
-    return spec
+    return deepcopy(cached[1])
 
 
 def render_job_spec_template(
@@ -700,6 +823,52 @@ job_name_pattern: "exp_{{{{ learning_rate }}}}_bs{{{{ batch_size }}}}"
 # Job Generator Class
 # =============================================================================
 
+# Compiled job script templates keyed by resolved path, with the
+# (mtime_ns, size) stamp they were compiled from. Sweeps build one
+# JobGenerator per spec, and specs commonly share a template.
+_TEMPLATE_CACHE: Dict[str, Tuple[Tuple[int, int], Template]] = {}
+
+
+def _jinja_bytecode_cache_dir() -> Path:
+    """Return the per-user directory for compiled job template bytecode."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "slurmkit" / "jinja"
+
+
+@lru_cache(maxsize=8)
+def _job_template_bytecode_cache(directory: str) -> Optional[FileSystemBytecodeCache]:
+    """
+    Return a bytecode cache for job script templates, or None if unusable.
+
+    Jinja keys bytecode by template name and file path, not by environment
+    options, so the file pattern is specific to JobGenerator environments.
+    """
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return None
+    if not os.access(directory, os.W_OK):
+        return None
+    return FileSystemBytecodeCache(directory, pattern="slurmkit_job_%s.cache")
+
+
+def _get_script_template(env: Environment, template_path: Path) -> Template:
+    """Compile ``template_path`` through ``env``, reusing unchanged compiles."""
+    try:
+        resolved_path = template_path.resolve()
+        file_stat = resolved_path.stat()
+    except OSError:
+        # Let Jinja raise its usual TemplateNotFound.
+        return env.get_template(template_path.name)
+
+    cache_key = str(resolved_path)
+    stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _TEMPLATE_CACHE.get(cache_key)
+    if cached is None or cached[0] != stamp:
+        cached = _TEMPLATE_CACHE[cache_key] = (stamp, env.get_template(template_path.name))
+    return cached[1]
+
+
 class JobGenerator:
     """
     Generator for SLURM job scripts from templates and parameters.
@@ -802,14 +971,44 @@ class JobGenerator:
                 self.slurm_logic_function,
             )
 
-        # Set up Jinja2 environment
+        # Set up Jinja2 environment. Compiled templates persist across CLI
+        # invocations unless jinja_bytecode_cache is disabled in config.
         template_dir = self.template_path.parent
+        bytecode_cache = None
+        if config.get("jinja_bytecode_cache"):
+            bytecode_cache = _job_template_bytecode_cache(str(_jinja_bytecode_cache_dir()))
         self._env = Environment(
             loader=FileSystemLoader(str(template_dir)),
             keep_trailing_newline=True,
             trim_blocks=True,    # removes the first newline after a block tag
             lstrip_blocks=True,  # strips leading whitespace from block-tag lines
+            bytecode_cache=bytecode_cache,
         )
+        # Compiled on first use and reused for every job this generator renders.
+        self._template: Optional[Template] = None
+        self._name_template: Optional[Template] = None
+        self._sorted_name_keys: Dict[Tuple[Any, ...], List[Any]] = {}
+
+    def _iter_parameters(self) -> Iterator[Dict[str, Any]]:
+        return iter_parameters(
+            self.parameters,
+            filter_func=self.param_filter_func,
+            parse_func=self.param_parse_func,
+        )
+
+    def _job_name(self, params: Dict[str, Any]) -> str:
+        """Generate a job name, compiling ``job_name_pattern`` at most once."""
+        if self.job_name_pattern is None:
+            # Same default naming as generate_job_name, but grid combinations
+            # share one key order, so sort each distinct key set only once.
+            key_set = tuple(params)
+            sorted_keys = self._sorted_name_keys.get(key_set)
+            if sorted_keys is None:
+                sorted_keys = self._sorted_name_keys[key_set] = sorted(key_set)
+            return "_".join(f"{key}{params[key]}" for key in sorted_keys)
+        if self._name_template is None:
+            self._name_template = self._env.from_string(self.job_name_pattern)
+        return generate_job_name(params, template=self._name_template)
 
     def _render_job(self, params: Dict[str, Any], job_name: str) -> Tuple[Dict[str, Any], str]:
         """
@@ -822,7 +1021,9 @@ class JobGenerator:
         Returns:
             Tuple of (slurm_args, rendered_content).
         """
-        template = self._env.get_template(self.template_path.name)
+        if self._template is None:
+            self._template = _get_script_template(self._env, self.template_path)
+        template = self._template
         slurm_args = compute_slurm_args(
             params,
             self.slurm_defaults,
@@ -835,7 +1036,9 @@ class JobGenerator:
             "params": params,
             **params,
         }
-        content = template.render(**context)
+        # Pass the context positionally: render(**context) would build a
+        # second kwargs dict per job before Jinja copies it again.
+        content = template.render(context)
         return slurm_args, content
 
     def generate_one(
@@ -864,14 +1067,9 @@ class JobGenerator:
         slurm_args, content = self._render_job(params, job_name)
         script_path = output_dir / f"{job_name}.job"
         if not dry_run:
-            script_path.write_text(content, encoding="utf-8")
+            _write_script(script_path, content)
 
-        return {
-            "job_name": job_name,
-            "script_path": script_path,
-            "parameters": params,
-            "slurm_args": slurm_args,
-        }
+        return _job_info(job_name, script_path, params, slurm_args)
 
     def render_script(
         self,
@@ -974,23 +1172,41 @@ class JobGenerator:
             - parameters: Job parameters
             - slurm_args: Computed SLURM arguments
         """
-        generated = []
-        for item in self.plan(output_dir=output_dir, collection=collection):
-            job_info = self.generate_one(
-                output_dir=output_dir,
-                params=item["parameters"],
-                job_name=item["job_name"],
-                dry_run=dry_run,
-            )
+        output_dir = Path(output_dir)
+        if not dry_run:
+            output_dir.mkdir(parents=True, exist_ok=True)
 
-            generated.append(job_info)
+        planned = self.plan(output_dir=output_dir, collection=collection)
+        generated = []
+        if dry_run:
+            # Render for slurm_args only: no writes, no pool, and dry-run
+            # planning must not mutate the target collection.
+            for item in planned:
+                slurm_args, _content = self._render_job(item["parameters"], item["job_name"])
+                generated.append(
+                    _job_info(item["job_name"], item["script_path"], item["parameters"], slurm_args)
+                )
+            return generated
+
+        # Rendering stays on this thread (Jinja holds the GIL); script writes
+        # go to a small pool so file I/O overlaps with rendering the next job.
+        with ThreadPoolExecutor(max_workers=GENERATE_WRITE_WORKERS) as executor:
+            writes = []
+            for item in planned:
+                slurm_args, content = self._render_job(item["parameters"], item["job_name"])
+                writes.append(executor.submit(_write_script, item["script_path"], content))
+                generated.append(
+                    _job_info(item["job_name"], item["script_path"], item["parameters"], slurm_args)
+                )
+            for write in writes:
+                write.result()
 
-            # Dry-run planning must not mutate the target collection.
-            if collection is not None and not dry_run:
+        if collection is not None:
+            for job_info in generated:
                 collection.add_job(
-                    job_name=item["job_name"],
+                    job_name=job_info["job_name"],
                     script_path=job_info["script_path"],
-                    parameters=item["parameters"],
+                    parameters=job_info["parameters"],
                 )
 
         return generated
@@ -1012,11 +1228,7 @@ class JobGenerator:
         """
         output_dir = Path(output_dir)
 
-        param_list = expand_parameters(
-            self.parameters,
-            filter_func=self.param_filter_func,
-            parse_func=self.param_parse_func,
-        )
+        param_iter = self._iter_parameters()
 
         used_names = set()
         if collection is not None:
@@ -1027,12 +1239,8 @@ class JobGenerator:
             )
 
         planned = []
-        for params in param_list:
-            base_job_name = generate_job_name(
-                params,
-                pattern=self.job_name_pattern,
-                env=self._env,
-            )
+        for params in param_iter:
+            base_job_name = self._job_name(params)
             job_name = make_unique_job_name(base_job_name, used_names)
             used_names.add(job_name)
             planned.append(
@@ -1056,24 +1264,16 @@ class JobGenerator:
         Returns:
             Rendered script content.
         """
-        # Expand parameters
-        param_list = expand_parameters(
-            self.parameters,
-            filter_func=self.param_filter_func,
-            parse_func=self.param_parse_func,
-        )
-
-        if index >= len(param_list):
-            raise IndexError(f"Index {index} out of range (max {len(param_list) - 1})")
-
-        params = param_list[index]
+        if index < 0:
+            params = list(self._iter_parameters())[index]
+        else:
+            # Only expand up to the requested combination.
+            params = next(itertools.islice(self._iter_parameters(), index, None), None)
+            if params is None:
+                raise IndexError(f"Index {index} out of range (max {self.count_jobs() - 1})")
 
         # Generate job name
-        job_name = generate_job_name(
-            params,
-            pattern=self.job_name_pattern,
-            env=self._env,
-        )
+        job_name = self._job_name(params)
 
         _, content = self._render_job(params=params, job_name=job_name)
         return content
@@ -1085,13 +1285,11 @@ class JobGenerator:
         Returns:
             Number of parameter combinations.
         """
-        return len(
-            expand_parameters(
-                self.parameters,
-                filter_func=self.param_filter_func,
-                parse_func=self.param_parse_func,
-            )
-        )
+        if self.param_parse_func is None and self.param_filter_func is None:
+            count = _count_unfiltered_parameters(self.parameters)
+            if count is not None:
+                return count
+        return sum(1 for _ in self._iter_parameters())
 
     def list_job_names(self) -> List[str]:
         """
@@ -1100,15 +1298,7 @@ class JobGenerator:
         Returns:
             List of job names.
         """
-        param_list = expand_parameters(
-            self.parameters,
-            filter_func=self.param_filter_func,
-            parse_func=self.param_parse_func,
-        )
-        return [
-            generate_job_name(params, pattern=self.job_name_pattern, env=self._env)
-            for params in param_list
-        ]
+        return [self._job_name(params) for params in self._iter_parameters()]
 
 
 # =============================================================================
@@ -21,12 +21,16 @@ import os
 import re
 import smtplib
 import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from email.message import EmailMessage
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import yaml
@@ -52,10 +56,16 @@ from slurmkit.notification_formatters import (
 )
 from slurmkit.slurm import find_job_output
 
-try:
-    import requests
-except ImportError:  # pragma: no cover - guarded by packaging dependency
-    requests = None
+
+@lru_cache(maxsize=1)
+def _requests() -> Optional[ModuleType]:
+    # requests (urllib3, certifi, ...) is imported on first HTTP delivery so
+    # dry runs, email routes, and payload building do not pay for it.
+    try:
+        import requests
+    except ImportError:  # pragma: no cover - guarded by packaging dependency
+        return None
+    return requests
 
 
 ROUTE_TYPES = {"webhook", "slack", "discord", "email"}
@@ -69,6 +79,13 @@ SCHEMA_VERSION = "v1"
 
 _ENV_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
 
+# Block size used when reading job output tails backwards.
+_OUTPUT_TAIL_BLOCK_SIZE = 64 * 1024
+
+# Route delivery is network-bound (HTTP/SMTP plus retry backoff), so routes
+# are sent concurrently and dispatch takes as long as the slowest route.
+DISPATCH_MAX_WORKERS = 8
+
 
 class NotificationConfigError(ValueError):
     """Raised when notification configuration is invalid."""
@@ -184,14 +201,8 @@ def _normalize_events(value: Any, fallback: Optional[List[str]] = None) -> List[
     else:
         events = list(fallback)
 
-    deduped = []
-    seen = set()
-    for event in events:
-        if event in seen:
-            continue
-        seen.add(event)
-        deduped.append(event)
-
+    # dict.fromkeys drops repeats while keeping first-seen order.
+    deduped = list(dict.fromkeys(events))
     return deduped or list(fallback)
 
 
@@ -243,19 +254,22 @@ def _to_bool(value: Any, default: bool) -> bool:
 
 
 
-def _interpolate_env_string(value: str) -> str:
-    """Resolve ${VAR} placeholders from environment variables."""
+def _replace_env_match(match: re.Match) -> str:
+    """Return the environment value for one ${VAR} placeholder match."""
+    var_name = match.group(1)
+    var_value = os.environ.get(var_name)
+    if var_value is None:
+        raise NotificationConfigError(
+            f"Missing environment variable '{var_name}' required by notification config."
+        )
+    return var_value
 
-    def replace(match: re.Match) -> str:
-        var_name = match.group(1)
-        var_value = os.environ.get(var_name)
-        if var_value is None:
-            raise NotificationConfigError(
-                f"Missing environment variable '{var_name}' required by notification config."
-            )
-        return var_value
 
-    return _ENV_PATTERN.sub(replace, value)
+def _interpolate_env_string(value: str) -> str:
+    """Resolve ${VAR} placeholders from environment variables."""
+    if "${" not in value:
+        return value
+    return _ENV_PATTERN.sub(_replace_env_match, value)
 
 
 
@@ -276,20 +290,49 @@ def _interpolate_env(value: Any) -> Any:
 
 def _read_output_tail(path: Path, lines: int) -> Optional[str]:
     """Read the trailing lines from an output file."""
-    if not path.exists():
+    if lines <= 0:
         return None
 
+    # Job logs can be gigabytes; read backwards in blocks until enough
+    # complete lines are buffered instead of loading the whole file.
     try:
-        content = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        with open(path, "rb") as f:
+            position = f.seek(0, os.SEEK_END)
+            blocks: List[bytes] = []
+            newlines = 0
+            while position > 0 and newlines <= lines:
+                step = min(_OUTPUT_TAIL_BLOCK_SIZE, position)
+                position -= step
+                f.seek(position)
+                block = f.read(step)
+                blocks.append(block)
+                newlines += block.count(b"\n")
     except OSError:
         return None
 
-    if lines <= 0:
-        return None
+    data = b"".join(reversed(blocks))
+    if position > 0:
+        # Drop the partial line at the start of the buffer; cutting after a
+        # newline also keeps the UTF-8 decode aligned.
+        data = data[data.index(b"\n") + 1:]
+    content = data.decode("utf-8", errors="replace").splitlines()
     return "\n".join(content[-lines:]) if content else ""
 
 
 
+def _delivery_deadline(route: NotificationRoute) -> float:
+    """Return the monotonic time after which a route stops retrying."""
+    return time.monotonic() + route.timeout_seconds * route.max_attempts * 3
+
+
+def _retry_delay(route: NotificationRoute, attempts: int, deadline: float) -> Optional[float]:
+    """Return the backoff before the next attempt, or None once past ``deadline``."""
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return None
+    return min(route.backoff_seconds * (2 ** (attempts - 1)), remaining)
+
+
 def _match_collection_job(
     collection: Collection,
     job_id: str,
@@ -357,6 +400,28 @@ class NotificationService:
         self.config = config
         self.collection_manager = collection_manager or CollectionManager(config=config)
         self._emitted_config_warnings: set = set()
+        # Stamped into every payload; it cannot change within a process.
+        self._hostname = socket.gethostname()
+        # One pooled session reuses connections (and TLS handshakes) across
+        # retries and routes that share a host; created on first HTTP send.
+        self._session: Any = None
+        self._session_lock = threading.Lock()
+
+    def _get_session(self, requests: ModuleType) -> Any:
+        """Return the shared HTTP session, creating it on first use."""
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                # Retries stay in _send_json so the backoff policy is explicit.
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=DISPATCH_MAX_WORKERS,
+                    pool_maxsize=2 * DISPATCH_MAX_WORKERS,
+                    max_retries=0,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+            return self._session
 
     def _append_config_warning(
         self,
@@ -520,6 +585,11 @@ class NotificationService:
             collection_name=collection_name,
             warnings=warnings,
         )
+        return self._defaults_from_config(notifications_cfg)
+
+    @staticmethod
+    def _defaults_from_config(notifications_cfg: Dict[str, Any]) -> NotificationDefaults:
+        """Normalize the ``defaults`` block of a resolved notifications config."""
         defaults_raw = notifications_cfg.get("defaults", {}) or {}
         events = _normalize_events(defaults_raw.get("events"), fallback=[DEFAULT_EVENT_FAILED])
 
@@ -749,10 +819,9 @@ class NotificationService:
             collection_name=collection_name,
             warnings=warnings,
         )
-        defaults = self.get_defaults(
-            collection_name=collection_name,
-            warnings=warnings,
-        )
+        # Derive defaults from the same resolved config rather than resolving
+        # (and re-reading the collection spec) a second time.
+        defaults = self._defaults_from_config(notifications_cfg)
         global_formatter_callback, global_formatter_warning = resolve_global_formatter_callback(
             notifications_cfg=notifications_cfg
         )
@@ -864,7 +933,7 @@ class NotificationService:
                 )
 
         matches: List[Collection] = []
-        for name in self.collection_manager.list_collections():
+        for name in self.collection_manager.find_collections_by_job_id(job_id, warnings):
             try:
                 collection = self.collection_manager.load(name)
             except Exception as exc:
@@ -920,7 +989,7 @@ class NotificationService:
             else:
                 collection_names = [collection_name]
         else:
-            collection_names = self.collection_manager.list_collections()
+            collection_names = self.collection_manager.find_collections_by_job_id(job_id, warnings)
 
         for name in collection_names:
             try:
@@ -1481,7 +1550,7 @@ class NotificationService:
             "job": context["job"],
             "collection": context["collection"],
             "host": {
-                "hostname": socket.gethostname(),
+                "hostname": self._hostname,
             },
             "meta": {
                 "route_name": None,
@@ -1529,7 +1598,7 @@ class NotificationService:
             "ai_status": ai_status,
             "ai_summary": ai_summary,
             "host": {
-                "hostname": socket.gethostname(),
+                "hostname": self._hostname,
             },
             "meta": {
                 "route_name": None,
@@ -1558,7 +1627,7 @@ class NotificationService:
             },
             "collection": None,
             "host": {
-                "hostname": socket.gethostname(),
+                "hostname": self._hostname,
             },
             "meta": {
                 "route_name": None,
@@ -1568,11 +1637,16 @@ class NotificationService:
 
     def _route_payload(self, route: NotificationRoute, base_payload: Dict[str, Any]) -> Dict[str, Any]:
         """Build route-scoped canonical payload with route metadata."""
-        payload = copy.deepcopy(base_payload)
-        payload.setdefault("meta", {})
-        payload["meta"]["route_name"] = route.name
-        payload["meta"]["route_type"] = route.route_type
-        return payload
+        # Only "meta" differs per route, so copy just that level. Everything
+        # else is read-only downstream (formatter callbacks get a deepcopy).
+        return {
+            **base_payload,
+            "meta": {
+                **base_payload.get("meta", {}),
+                "route_name": route.name,
+                "route_type": route.route_type,
+            },
+        }
 
     def _send_email(
         self,
@@ -1602,6 +1676,7 @@ class NotificationService:
             )
 
         attempts = 0
+        deadline = _delivery_deadline(route)
         for attempts in range(1, route.max_attempts + 1):
             try:
                 message = EmailMessage()
@@ -1642,8 +1717,9 @@ class NotificationService:
                     attempts=attempts,
                 )
             except (smtplib.SMTPException, OSError) as exc:
-                if attempts < route.max_attempts:
-                    time.sleep(route.backoff_seconds * (2 ** (attempts - 1)))
+                delay = _retry_delay(route, attempts, deadline) if attempts < route.max_attempts else None
+                if delay is not None:
+                    time.sleep(delay)
                     continue
                 return DeliveryResult(
                     route_name=route.name,
@@ -1677,6 +1753,7 @@ class NotificationService:
                 dry_run=True,
             )
 
+        requests = _requests()
         if requests is None:
             return DeliveryResult(
                 route_name=route.name,
@@ -1685,22 +1762,39 @@ class NotificationService:
                 attempts=0,
                 error="requests dependency is not available",
             )
+        session = self._get_session(requests)
 
         headers = {"Content-Type": "application/json"}
         headers.update(route.headers)
 
+        # Encode once up front; passing json= would re-serialize the payload
+        # (including any output tail) on every retry.
+        try:
+            body = json.dumps(payload, allow_nan=False).encode("utf-8")
+        except (TypeError, ValueError) as exc:
+            return DeliveryResult(
+                route_name=route.name,
+                route_type=route.route_type,
+                success=False,
+                attempts=0,
+                error=f"Payload is not JSON serializable: {exc}",
+            )
+
         attempts = 0
+        # Bound total delivery time so a dead route cannot stall dispatch.
+        deadline = _delivery_deadline(route)
         for attempts in range(1, route.max_attempts + 1):
             try:
-                response = requests.post(
+                response = session.post(
                     route.url,
-                    json=payload,
+                    data=body,
                     headers=headers,
                     timeout=route.timeout_seconds,
                 )
             except requests.RequestException as exc:
-                if attempts < route.max_attempts:
-                    time.sleep(route.backoff_seconds * (2 ** (attempts - 1)))
+                delay = _retry_delay(route, attempts, deadline) if attempts < route.max_attempts else None
+                if delay is not None:
+                    time.sleep(delay)
                     continue
                 return DeliveryResult(
                     route_name=route.name,
@@ -1725,7 +1819,10 @@ class NotificationService:
             if body_excerpt:
                 error = f"{error}: {body_excerpt}"
 
-            if 400 <= status < 500 or attempts >= route.max_attempts:
+            delay = None
+            if not (400 <= status < 500 or attempts >= route.max_attempts):
+                delay = _retry_delay(route, attempts, deadline)
+            if delay is None:
                 return DeliveryResult(
                     route_name=route.name,
                     route_type=route.route_type,
@@ -1735,7 +1832,7 @@ class NotificationService:
                     error=error,
                 )
 
-            time.sleep(route.backoff_seconds * (2 ** (attempts - 1)))
+            time.sleep(delay)
 
         return DeliveryResult(
             route_name=route.name,
@@ -1745,67 +1842,83 @@ class NotificationService:
             error="Delivery failed after retries",
         )
 
+    def _dispatch_route(
+        self,
+        route: NotificationRoute,
+        payload: Dict[str, Any],
+        dry_run: bool = False,
+    ) -> DeliveryResult:
+        """Format and deliver ``payload`` to a single route."""
+        route_payload = self._route_payload(route, payload)
+        formatter_overrides: Dict[str, str] = {}
+        formatter_warning: Optional[str] = None
+
+        if route.route_type in {"slack", "discord", "email"}:
+            formatter_overrides, formatter_warning = apply_formatter_callback(
+                payload=route_payload,
+                callback_loader=self._load_callback,
+                callback_path=route.formatter_callback,
+            )
+
+        if route.route_type == "webhook":
+            result = self._send_json(route, route_payload, dry_run=dry_run)
+        elif route.route_type == "slack":
+            chat_message = (
+                formatter_overrides["chat"]
+                if "chat" in formatter_overrides
+                else render_default_chat(route_payload)
+            )
+            result = self._send_json(route, {"text": chat_message}, dry_run=dry_run)
+        elif route.route_type == "discord":
+            chat_message = (
+                formatter_overrides["chat"]
+                if "chat" in formatter_overrides
+                else render_default_chat(route_payload)
+            )
+            result = self._send_json(route, {"content": chat_message}, dry_run=dry_run)
+        elif route.route_type == "email":
+            subject = (
+                formatter_overrides["email_subject"]
+                if "email_subject" in formatter_overrides
+                else render_default_email_subject(route_payload)
+            )
+            body = (
+                formatter_overrides["email_body"]
+                if "email_body" in formatter_overrides
+                else render_default_email_body(route_payload)
+            )
+            result = self._send_email(
+                route,
+                route_payload,
+                subject=subject,
+                body=body,
+                dry_run=dry_run,
+            )
+        else:
+            raise NotificationConfigError(f"Unsupported route type '{route.route_type}'.")
+
+        if formatter_warning:
+            result.warning = formatter_warning
+        return result
+
     def dispatch(
         self,
         payload: Dict[str, Any],
         routes: List[NotificationRoute],
         dry_run: bool = False,
     ) -> List[DeliveryResult]:
-        """Dispatch payload to all selected routes."""
-        results = []
+        """Dispatch payload to all selected routes, returning results in route order."""
         for route in routes:
-            route_payload = self._route_payload(route, payload)
-            formatter_overrides: Dict[str, str] = {}
-            formatter_warning: Optional[str] = None
-
-            if route.route_type in {"slack", "discord", "email"}:
-                formatter_overrides, formatter_warning = apply_formatter_callback(
-                    payload=route_payload,
-                    callback_loader=self._load_callback,
-                    callback_path=route.formatter_callback,
-                )
-
-            if route.route_type == "webhook":
-                result = self._send_json(route, route_payload, dry_run=dry_run)
-            elif route.route_type == "slack":
-                chat_message = (
-                    formatter_overrides["chat"]
-                    if "chat" in formatter_overrides
-                    else render_default_chat(route_payload)
-                )
-                result = self._send_json(route, {"text": chat_message}, dry_run=dry_run)
-            elif route.route_type == "discord":
-                chat_message = (
-                    formatter_overrides["chat"]
-                    if "chat" in formatter_overrides
-                    else render_default_chat(route_payload)
-                )
-                result = self._send_json(route, {"content": chat_message}, dry_run=dry_run)
-            elif route.route_type == "email":
-                subject = (
-                    formatter_overrides["email_subject"]
-                    if "email_subject" in formatter_overrides
-                    else render_default_email_subject(route_payload)
-                )
-                body = (
-                    formatter_overrides["email_body"]
-                    if "email_body" in formatter_overrides
-                    else render_default_email_body(route_payload)
-                )
-                result = self._send_email(
-                    route,
-                    route_payload,
-                    subject=subject,
-                    body=body,
-                    dry_run=dry_run,
-                )
-            else:
+            if route.route_type not in ROUTE_TYPES:
                 raise NotificationConfigError(f"Unsupported route type '{route.route_type}'.")
 
-            if formatter_warning:
-                result.warning = formatter_warning
-            results.append(result)
-        return results
+        if dry_run or len(routes) <= 1:
+            return [self._dispatch_route(route, payload, dry_run=dry_run) for route in routes]
+
+        max_workers = min(DISPATCH_MAX_WORKERS, len(routes))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map() preserves route order in the returned results.
+            return list(executor.map(lambda route: self._dispatch_route(route, payload), routes))
 
     def evaluate_delivery(self, results: List[DeliveryResult], strict: bool = False) -> int:
         """
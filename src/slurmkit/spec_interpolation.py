@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Mapping, Optional
 
-from jinja2 import Environment, StrictUndefined, TemplateError, UndefinedError
 
+@lru_cache(maxsize=1)
+def _get_env():
+    from jinja2 import Environment, StrictUndefined
 
-_ENV = Environment(undefined=StrictUndefined, autoescape=False)
+    return Environment(undefined=StrictUndefined, autoescape=False)
 
 
 def has_template_syntax(value: str) -> bool:
@@ -88,9 +91,11 @@ def render_spec_string(
     context: Mapping[str, Any],
 ) -> str:
     """Render a spec string with strict undefined-variable handling."""
+    from jinja2 import TemplateError, UndefinedError
+
     raw_value = str(value)
     try:
-        return _ENV.from_string(raw_value).render(**context)
+        return _get_env().from_string(raw_value).render(**context)
     except UndefinedError as exc:
         available = ", ".join(sorted(context.keys())) or "(none)"
         raise ValueError(
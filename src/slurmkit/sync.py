@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import socket
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -25,6 +26,16 @@ from slurmkit.config import Config, get_config
 from slurmkit.collections import Collection, CollectionManager
 
 
+# Per-collection sync is dominated by sacct subprocesses and file I/O, so a
+# small thread pool overlaps that waiting across collections.
+SYNC_MAX_WORKERS = 8
+
+# Sync files embed every tracked job, so prefer the libyaml-backed
+# loader/dumper when PyYAML was built with it.
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
+
 # =============================================================================
 # Sync File Management
 # =============================================================================
@@ -105,8 +116,8 @@ class SyncManager:
         # Refresh states from SLURM
         updated_count = collection.refresh_states()
 
-        # Save updated collection
-        self._collection_manager.save(collection)
+        # Save updated collection (skipped when nothing changed)
+        self._collection_manager.save_if_dirty(collection)
 
         # Build sync data
         summary = collection.get_summary()
@@ -142,6 +153,26 @@ class SyncManager:
             "jobs": jobs_data,
         }
 
+    def _try_sync_collection(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Sync one collection, returning None when it is skipped.
+
+        Args:
+            name: Collection name.
+
+        Returns:
+            Collection sync data, or None if missing or failed.
+        """
+        try:
+            return self.sync_collection(name)
+        except FileNotFoundError:
+            # Skip collections that don't exist
+            return None
+        except Exception as e:
+            # Log error but continue with other collections
+            print(f"Warning: Error syncing collection '{name}': {e}")
+            return None
+
     def sync_all(
         self,
         collection_names: Optional[List[str]] = None,
@@ -162,18 +193,16 @@ class SyncManager:
         collections_data = {}
         total_updated = 0
 
-        for name in collection_names:
-            try:
-                data = self.sync_collection(name)
+        if collection_names:
+            max_workers = min(SYNC_MAX_WORKERS, len(collection_names))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # map() preserves input order, keeping the sync file stable.
+                results = list(executor.map(self._try_sync_collection, collection_names))
+            for name, data in zip(collection_names, results):
+                if data is None:
+                    continue
                 collections_data[name] = data
                 total_updated += data.get("updated_jobs", 0)
-            except FileNotFoundError:
-                # Skip collections that don't exist
-                continue
-            except Exception as e:
-                # Log error but continue with other collections
-                print(f"Warning: Error syncing collection '{name}': {e}")
-                continue
 
         # Build sync file data
         sync_data = {
@@ -192,6 +221,7 @@ class SyncManager:
             yaml.dump(
                 sync_data,
                 f,
+                Dumper=_YAML_DUMPER,
                 default_flow_style=False,
                 sort_keys=False,
                 allow_unicode=True,
@@ -215,7 +245,7 @@ class SyncManager:
             return None
 
         with open(path, "r") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YAML_SAFE_LOADER)
 
     def list_sync_files(self) -> List[str]:
         """
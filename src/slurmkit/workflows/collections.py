@@ -123,6 +123,7 @@ def show_collection(
     include_jobs_table: bool = True,
     include_jobs_in_payload: bool = True,
     jobs_table_columns: Optional[List[str]] = None,
+    jobs_table_max_rows: Optional[int] = None,
     compact_payload: bool = False,
 ) -> RenderableReport:
     from slurmkit.cli.ui import build_collection_show_report
@@ -158,7 +159,7 @@ def show_collection(
     collection = manager.load(name)
     if refresh:
         collection.refresh_states()
-        manager.save(collection)
+        manager.save_if_dirty(collection)
 
     effective_state = None if state_filter == "all" else state_filter
     all_effective_jobs = collection.get_effective_jobs(
@@ -365,6 +366,7 @@ def show_collection(
         summary_jobs=summary_jobs,
         include_jobs_table=include_jobs_table,
         jobs_table_columns=jobs_table_columns,
+        jobs_table_max_rows=jobs_table_max_rows,
         runtime_now=runtime_now,
         estimated_completion_at=estimated_completion_at,
         estimated_remaining_seconds=estimated_remaining_seconds,
@@ -396,7 +398,7 @@ def analyze_collection(
     collection = manager.load(name)
     if refresh:
         collection.refresh_states()
-        manager.save(collection)
+        manager.save_if_dirty(collection)
     analysis = collection.analyze_status_by_params(
         attempt_mode=attempt_mode,
         submission_group=submission_group,
@@ -424,16 +426,16 @@ def refresh_collections(
     refresh_all: bool,
 ) -> Dict[str, int]:
     names = manager.list_collections() if refresh_all else [str(name)]
-    total_updates = 0
-    refreshed = 0
-    for collection_name in names:
-        if not collection_name or not manager.exists(collection_name):
-            continue
-        collection = manager.load(collection_name)
-        total_updates += collection.refresh_states()
-        manager.save(collection)
-        refreshed += 1
-    return {"collections_refreshed": refreshed, "jobs_updated": total_updates}
+    collections = [
+        manager.load(collection_name)
+        for collection_name in names
+        if collection_name and manager.exists(collection_name)
+    ]
+    # One sacct query covers every collection instead of one per collection.
+    updates = manager.refresh_all(collections)
+    for collection in collections:
+        manager.save_if_dirty(collection)
+    return {"collections_refreshed": len(collections), "jobs_updated": sum(updates)}
 
 
 @dataclass
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 import re
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 
 from slurmkit.collections import (
     Collection,
@@ -19,10 +19,12 @@ from slurmkit.collections import (
     JOB_STATE_UNKNOWN,
 )
 from slurmkit.config import Config
-from slurmkit.generate import JobGenerator, load_job_spec
 from slurmkit.spec_interpolation import has_template_syntax
 from slurmkit.slurm import resolve_job_output_path, submit_job
 
+if TYPE_CHECKING:
+    from slurmkit.generate import JobGenerator
+
 from .shared import (
     ReviewPlan,
     build_generation_metadata,
@@ -196,6 +198,8 @@ def plan_generate(
     spec_path: Path,
     collection_name: str,
 ) -> GeneratePlan:
+    from slurmkit.generate import JobGenerator, load_job_spec
+
     spec_data = load_job_spec(spec_path)
     existing_collection = manager.load(collection_name) if manager.exists(collection_name) else None
     generator = JobGenerator.from_spec(
@@ -475,6 +479,8 @@ def plan_resubmit_collection(
     generation_context: Optional[Dict[str, Any]] = None
     resubmit_generator: Optional[JobGenerator] = None
     if resolved_regenerate:
+        from slurmkit.generate import JobGenerator
+
         generation_context = resolve_generation_context(
             collection,
             template_override=template,
@@ -216,7 +216,7 @@ def run_collection_final_notification(
         collection = manager.load(resolved_collection_name)
         if not no_refresh:
             collection.refresh_states()
-            manager.save(collection)
+            manager.save_if_dirty(collection)
 
         cfg_warnings: List[str] = []
         cfg = service.get_collection_final_config(collection=collection, warnings=cfg_warnings)
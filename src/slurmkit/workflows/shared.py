@@ -7,13 +7,15 @@ import sys
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence
 
 from slurmkit.collections import Collection
 from slurmkit.config import Config
-from slurmkit.generate import JobGenerator, resolve_spec_job_paths
 from slurmkit.spec_interpolation import build_job_subdir_context
 
+if TYPE_CHECKING:
+    from slurmkit.generate import JobGenerator
+
 
 @dataclass(frozen=True)
 class ReviewPlan:
@@ -27,9 +29,9 @@ def parse_key_value_pairs(raw: Optional[str]) -> Dict[str, str]:
     if not raw:
         return parsed
     for item in raw.split(","):
-        if "=" not in item:
+        key, sep, value = item.partition("=")
+        if not sep:
             continue
-        key, value = item.split("=", 1)
         key = key.strip()
         if key:
             parsed[key] = value.strip()
@@ -166,6 +168,8 @@ def resolve_job_paths_from_spec(
         collection_name=collection_name,
         project_root=getattr(config, "project_root", None),
     )
+    from slurmkit.generate import resolve_spec_job_paths
+
     resolved = resolve_spec_job_paths(spec_data, config, interpolation_context=context)
     scripts_dir = Path(str(resolved["scripts_dir"]))
     logs_dir = Path(str(resolved["logs_dir"]))
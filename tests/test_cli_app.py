@@ -78,6 +78,18 @@ def test_root_no_args_prints_help_when_not_interactive():
     assert "Usage:" in result.stdout
 
 
+def test_main_version_matches_typer_callback(capsys):
+    from slurmkit._version import __version__
+    from slurmkit.cli.main import main
+
+    assert main(["--version"]) == 0
+    assert capsys.readouterr().out.strip() == __version__
+
+    result = runner.invoke(cli_app, ["--version"])
+    assert result.exit_code == 0
+    assert result.stdout.strip() == __version__
+
+
 def test_root_no_args_opens_picker_when_prompting_enabled(monkeypatch):
     from importlib import import_module
 
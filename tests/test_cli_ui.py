@@ -6,7 +6,8 @@ from types import SimpleNamespace
 import pytest
 
 from slurmkit.cli.ui.models import MetricItem
-from slurmkit.cli.ui.context import UIResolutionError, resolve_ui_context
+from slurmkit.cli.ui.backend import create_ui_backend
+from slurmkit.cli.ui.context import UIContext, UIResolutionError, resolve_ui_context
 from slurmkit.cli.ui.plain import PlainBackend
 from slurmkit.cli.ui.rich_backend import RichBackend
 from slurmkit.cli.ui.reports import build_collection_show_report
@@ -66,6 +67,83 @@ def test_plain_backend_status_color_toggle():
     assert "\033[" in styled
 
 
+def test_create_ui_backend_returns_fresh_backend_per_call():
+    """Stateful backends must not be shared between callers."""
+    def make_ctx(mode, color):
+        return UIContext(
+            requested_mode=mode,
+            configured_mode=mode,
+            effective_mode=mode,
+            is_tty=False,
+            rich_available=True,
+            plain_color_enabled=color,
+        )
+
+    first = create_ui_backend(make_ctx("plain", False))
+    assert isinstance(first, PlainBackend)
+    assert create_ui_backend(make_ctx("plain", False)) is not first
+    colored = create_ui_backend(make_ctx("plain", True))
+    assert "\033[" in colored.style_status("FAILED")
+    assert "\033[" not in first.style_status("FAILED")
+    assert isinstance(create_ui_backend(make_ctx("rich", False)), RichBackend)
+    with pytest.raises(ValueError):
+        create_ui_backend(make_ctx("bogus", False))
+
+
+def test_plain_backend_simple_table_matches_tabulate():
+    """The fast plain renderer should produce tabulate's simple layout."""
+    from tabulate import tabulate
+
+    from slurmkit.cli.ui.plain import _render_simple_table
+
+    backend = PlainBackend(enable_color=True)
+    headers = ["Job ID", "Name", "State", "Runtime"]
+    rows = [
+        ("12345", "train_lr_0.1", backend.style_status("COMPLETED"), "1h 05m"),
+        ("7", "eval", backend.style_status("FAILED"), ""),
+        ("", "not_yet_submitted_job", "", ""),
+    ]
+    rendered = _render_simple_table(headers, rows)
+    assert rendered == tabulate(rows, headers=headers, tablefmt="simple")
+
+    # Values whose tabulate formatting is not replicated fall back to tabulate.
+    assert _render_simple_table(["Score"], [("0.50",)]) is None
+
+
+_GREEN = "\033[32m"
+_RESET = "\033[0m"
+
+
+@pytest.mark.parametrize(
+    ("headers", "rows"),
+    [
+        (["Job ID", "Count"], [("12345", "3"), ("-7", "10")]),
+        (["Job", "Exit"], [("train", f"{_GREEN}0{_RESET}"), ("eval", f"{_GREEN}12{_RESET}")]),
+        (["Job", "State"], [("a", ""), ("", ""), ("b", f"{_GREEN}COMPLETED{_RESET}")]),
+        (["Value", "Score"], [("0.50", "1e3"), ("1,000", "+5"), ("True", "nan")]),
+        (["xxxxxxx", "Job", "State"], [("a\tb", "abc", "a")]),
+        (["Param\tValue", "Count"], [("lr", "3")]),
+        (["Value"], [("\tlead", ), ("mid\tdle", )]),
+        (["Name", "Mixed"], [("x", "12"), ("y", "abc"), ("z", "")]),
+    ],
+)
+def test_plain_backend_table_output_matches_tabulate(headers, rows):
+    """Fast path or fallback, table output should equal tabulate's simple layout."""
+    from tabulate import tabulate
+
+    from slurmkit.cli.ui.plain import _format_simple_table
+
+    assert _format_simple_table(headers, rows) == tabulate(rows, headers=headers, tablefmt="simple")
+
+
+def test_plain_backend_simple_table_skips_tabs():
+    """Tab-containing cells or headers are left to tabulate's tab expansion."""
+    from slurmkit.cli.ui.plain import _render_simple_table
+
+    assert _render_simple_table(["xxxxxxx", "Job"], [("a\tb", "abc")]) is None
+    assert _render_simple_table(["Param\tValue"], [("lr",)]) is None
+
+
 def test_collection_show_report_supports_primary_and_history_columns():
     """Collection show report should include configured primary/history columns."""
     class _Collection:
@@ -113,6 +191,40 @@ def test_collection_show_report_supports_primary_and_history_columns():
     )
 
 
+def test_collection_show_report_caps_jobs_table_rows():
+    """A row cap should truncate the jobs table but keep the full summary."""
+
+    class _Collection:
+        name = "exp_big"
+        description = ""
+        created_at = "2026-02-07T10:00:00"
+        updated_at = "2026-02-07T11:00:00"
+        cluster = "cluster-a"
+
+    jobs = [
+        {
+            "job_name": f"job_{index}",
+            "effective_job_id": str(100 + index),
+            "effective_state_raw": "COMPLETED",
+            "primary_job_id": str(100 + index),
+        }
+        for index in range(5)
+    ]
+    report = build_collection_show_report(
+        collection=_Collection(),
+        jobs=jobs,
+        summary={"total": 5, "completed": 5},
+        attempt_mode="latest",
+        submission_group=None,
+        jobs_table_columns=["job_name"],
+        jobs_table_max_rows=2,
+    )
+
+    assert [row[0] for row in report.jobs_table.rows] == ["job_0", "job_1"]
+    assert report.jobs_table.title.startswith("Jobs (5, showing first 2;")
+    assert report.summary_title.startswith("Summary: 5 primary jobs")
+
+
 def test_collection_show_report_hostname_column_is_opt_in():
     """Hostname should only appear when configured as a column."""
 
@@ -487,6 +599,19 @@ def test_plain_backend_metrics_renders_indented_details_line(capsys):
     assert "    FAILED: 2, TIMEOUT: 1" in output
 
 
+def test_plain_backend_nested_buffering_flushes_once_in_order(capsys):
+    """Nested ``with backend:`` blocks keep outer lines and flush at the outermost exit."""
+    backend = PlainBackend(enable_color=False, width=5)
+    with backend:
+        backend.heading("outer")
+        with backend:
+            backend.text("inner")
+        assert capsys.readouterr().out == ""
+        backend.text("after")
+
+    assert capsys.readouterr().out == "outer\n-----\ninner\nafter\n"
+
+
 def test_rich_backend_output_path_cell_renders_short_hyperlink_label():
     backend = RichBackend()
     rendered = backend._render_output_link("/tmp/demo_output.out")
@@ -48,6 +48,40 @@ def test_collection_add_job_and_resubmission_uses_attempts(tmp_path):
     assert job["attempts"][1]["extra_params"]["checkpoint"] == "last.pt"
 
 
+def test_collection_job_lookups_track_updates_and_removals():
+    collection = Collection("exp1")
+    collection.add_job("job1", script_path="jobs/job1.job", job_id="100")
+    collection.add_job("job2", script_path="jobs/job2.job")
+    collection.add_resubmission("job1", job_id="101")
+    collection.update_job("job2", job_id="200")
+
+    assert collection.get_job("job2")["attempts"][0]["job_id"] == "200"
+    assert collection.get_job_by_id("101") is collection.get_job("job1")
+    assert collection.get_job_by_id("200") is collection.get_job("job2")
+
+    collection.update_job("job1", job_id="102")
+    assert collection.get_job_by_id("100") is None
+    assert collection.get_job_by_id("102") is collection.get_job("job1")
+
+    assert collection.remove_job("job1") is True
+    assert collection.get_job("job1") is None
+    assert collection.get_job_by_id("101") is None
+    assert collection.remove_job("job1") is False
+    assert [job["job_name"] for job in collection.jobs] == ["job2"]
+
+
+def test_collection_remove_jobs_removes_batch_and_reindexes():
+    collection = Collection("exp1")
+    for index in range(4):
+        collection.add_job(f"job{index}", job_id=str(100 + index))
+
+    assert collection.remove_jobs(["job0", "job2", "missing"]) == 2
+    assert [job["job_name"] for job in collection.jobs] == ["job1", "job3"]
+    assert collection.get_job_by_id("100") is None
+    assert collection.get_job_by_id("103") is collection.get_job("job3")
+    assert collection.remove_jobs(["job0"]) == 0
+
+
 def test_collection_effective_jobs_latest_uses_last_attempt():
     collection = Collection("exp1")
     collection.add_job("job1", script_path="jobs/job1.job", job_id="100", state="FAILED", parameters={"lr": 0.1})
@@ -339,3 +373,124 @@ def test_collection_refresh_states_backfills_missing_output_path(monkeypatch, tm
 
     assert updated == 0
     assert collection.jobs[0]["attempts"][0]["output_path"] == str(logs_dir / "job1.100.out")
+
+
+def test_collection_manager_save_if_dirty_skips_unchanged_collections(monkeypatch, tmp_path):
+    manager = CollectionManager(collections_dir=tmp_path)
+    collection = Collection("exp1")
+    collection.add_job("job1", script_path="jobs/job1.job", job_id="100", state="COMPLETED")
+    assert collection.dirty is True
+    path = manager.save(collection)
+    assert collection.dirty is False
+
+    monkeypatch.setattr(
+        "slurmkit.collections.get_canonical_sacct_states",
+        lambda *_args, **_kwargs: {"100": {"state": "COMPLETED", "raw_state": None}},
+    )
+    restored = manager.load("exp1")
+    assert restored.refresh_states() == 0
+    assert manager.save_if_dirty(restored) is None
+
+    restored.update_job("job1", state="FAILED")
+    assert manager.save_if_dirty(restored) == path
+    assert manager.load("exp1").jobs[0]["attempts"][0]["state"] == "FAILED"
+
+
+def test_collection_manager_load_reuses_parse_until_file_changes(monkeypatch, tmp_path):
+    manager = CollectionManager(collections_dir=tmp_path)
+    collection = Collection("exp1", parameters={"grid": {"lr": [0.1]}})
+    collection.add_job("job1", script_path="jobs/job1.job", job_id="100", state="RUNNING")
+    path = manager.save(collection)
+
+    loads = []
+    real_load = yaml.load
+    monkeypatch.setattr(
+        "slurmkit.collections.yaml.load",
+        lambda *args, **kwargs: loads.append(1) or real_load(*args, **kwargs),
+    )
+
+    first = manager.load("exp1")
+    first.parameters["grid"]["lr"].append(0.2)
+    first.jobs[0]["attempts"][0]["state"] = "FAILED"
+    second = manager.load("exp1")
+    assert len(loads) == 1
+    assert second.parameters == {"grid": {"lr": [0.1]}}
+    assert second.jobs[0]["attempts"][0]["state"] == "RUNNING"
+
+    manager.save(first)
+    assert manager.load("exp1").jobs[0]["attempts"][0]["state"] == "FAILED"
+    assert len(loads) == 2
+
+    other = CollectionManager(collections_dir=tmp_path)
+    edited = other.load("exp1")
+    edited.description = "edited elsewhere"
+    other.save(edited)
+    os.utime(path, ns=(0, 0))
+    assert manager.load("exp1").description == "edited elsewhere"
+
+
+def test_collection_manager_refresh_all_queries_sacct_once(monkeypatch, tmp_path):
+    manager = CollectionManager(collections_dir=tmp_path)
+    first = Collection("exp1")
+    first.add_job("job1", script_path="jobs/job1.job", job_id="100", state="PENDING")
+    second = Collection("exp2")
+    second.add_job("job2", script_path="jobs/job2.job", job_id="200", state="PENDING")
+    second.add_job("job3", script_path="jobs/job3.job")
+
+    queries = []
+
+    def fake_states(job_ids):
+        queries.append(list(job_ids))
+        return {
+            "100": {"state": "COMPLETED", "raw_state": None},
+            "200": {"state": "RUNNING", "raw_state": None},
+        }
+
+    monkeypatch.setattr("slurmkit.collections.get_canonical_sacct_states", fake_states)
+
+    assert manager.refresh_all([first, second]) == [1, 1]
+    assert queries == [["100", "200"]]
+    assert first.jobs[0]["attempts"][0]["state"] == "COMPLETED"
+    assert second.get_job("job2")["attempts"][0]["state"] == "RUNNING"
+
+
+def test_git_metadata_uses_single_rev_parse(monkeypatch):
+    from slurmkit import collections as collections_module
+
+    calls = []
+
+    def fake_run_git_command(args):
+        calls.append(args)
+        return "0123abcd\nmain"
+
+    monkeypatch.setattr(collections_module, "_run_git_command", fake_run_git_command)
+    collections_module._get_git_metadata.cache_clear()
+    try:
+        metadata = collections_module._get_git_metadata()
+    finally:
+        collections_module._get_git_metadata.cache_clear()
+
+    assert metadata == {"git_branch": "main", "git_commit_id": "0123abcd"}
+    assert len(calls) == 1
+
+
+def test_collection_manager_find_collections_by_job_id_tracks_saves(tmp_path):
+    manager = CollectionManager(collections_dir=tmp_path)
+    first = Collection("exp1")
+    first.add_job("job1", script_path="jobs/job1.job", job_id="100")
+    manager.save(first)
+    second = Collection("exp2")
+    second.add_job("job1", script_path="jobs/job1.job", job_id="200")
+    manager.save(second)
+
+    assert manager.find_collections_by_job_id("100") == ["exp1"]
+    assert manager.find_collections_by_job_id("300") == []
+
+    second.add_resubmission("job1", job_id="300")
+    manager.save(second)
+    assert manager.find_collections_by_job_id("300") == ["exp2"]
+
+    (tmp_path / "broken.yaml").write_text("jobs: [\n", encoding="utf-8")
+    warnings = []
+    assert manager.find_collections_by_job_id("100", warnings) == ["exp1"]
+    assert warnings and "broken" in warnings[0]
@@ -197,3 +197,5 @@ class TestInitConfig:
             assert "# slurmkit configuration" in raw
             assert "pager: less  # less | none" in raw
             assert "# Jobs table columns for `slurmkit collections show` in display order." in raw
+            assert "jinja_bytecode_cache: true" in raw
+            assert yaml.safe_load(raw)["jinja_bytecode_cache"] is True
@@ -1,19 +1,24 @@
 """Tests for slurmkit.generate module."""
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 import yaml
+from jinja2 import Environment
 
 from slurmkit.generate import (
     expand_grid,
     expand_parameters,
+    iter_parameters,
     generate_job_name,
     JobGenerator,
     load_job_spec,
+    load_slurm_args_function,
     make_unique_job_name,
     render_job_spec_template,
+    _compile_name_pattern,
 )
 from slurmkit.collections import Collection
 from slurmkit.config import Config
@@ -88,6 +93,13 @@ class TestExpandParameters:
         assert result[0] == {"a": 1, "b": "x"}
         assert result[1] == {"a": 2, "b": "y"}
 
+    def test_iter_parameters_matches_expand_parameters(self):
+        """Test lazy expansion yields the same parameter dicts in order."""
+        spec = {"mode": "grid", "values": {"a": [1, 2], "b": ["x", "y"]}}
+        lazy = iter_parameters(spec)
+        assert not isinstance(lazy, list)
+        assert list(lazy) == expand_parameters(spec)
+
     def test_default_mode_is_grid(self):
         """Test that default mode is grid."""
         spec = {"values": {"a": [1, 2]}}
@@ -280,6 +292,29 @@ def test_make_unique_job_name_appends_numeric_suffix():
     assert make_unique_job_name("train", {"train", "train-2"}) == "train-3"
 
 
+def test_load_slurm_args_function_reuses_module_until_file_changes(tmp_path):
+    logic_path = tmp_path / "slurm_logic.py"
+    counter_path = tmp_path / "exec_count.txt"
+    logic_path.write_text(
+        "from pathlib import Path\n"
+        f"_counter = Path({str(counter_path)!r})\n"
+        "_counter.write_text(str(int(_counter.read_text() or 0) + 1) if _counter.exists() else '1')\n"
+        "def get_slurm_args(params, defaults):\n"
+        "    return {**defaults, 'mem': '8G'}\n"
+    )
+
+    first = load_slurm_args_function(logic_path)
+    second = load_slurm_args_function(logic_path)
+    assert first is second
+    assert counter_path.read_text() == "1"
+
+    logic_path.write_text(logic_path.read_text().replace("'8G'", "'16G'"))
+    os.utime(logic_path, ns=(0, 0))
+    reloaded = load_slurm_args_function(logic_path)
+    assert reloaded({}, {}) == {"mem": "16G"}
+    assert counter_path.read_text() == "2"
+
+
 def test_render_job_spec_template_has_core_fields_and_grid_mode():
     content = render_job_spec_template()
     assert "name: my_experiment" in content
@@ -319,6 +354,28 @@ def test_render_job_spec_template_includes_jobs_dir_hint(tmp_path):
     assert "logs:    custom_jobs/benchmarks/run_a/logs" in content
 
 
+@pytest.mark.parametrize("enabled", [True, False])
+def test_job_generator_bytecode_cache_follows_config(tmp_path, monkeypatch, enabled):
+    """Compiled templates are persisted under XDG_CACHE_HOME unless disabled."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    template = tmp_path / "train.job.j2"
+    template.write_text("#!/bin/bash\necho {{ seed }}\n", encoding="utf-8")
+    config_path = tmp_path / ".slurmkit" / "config.yaml"
+    config_path.parent.mkdir()
+    config_path.write_text(f"jinja_bytecode_cache: {str(enabled).lower()}\n", encoding="utf-8")
+    config = Config(project_root=tmp_path)
+
+    generator = JobGenerator(
+        template_path=template,
+        parameters={"mode": "list", "values": [{"seed": 1}]},
+        config=config,
+    )
+    assert generator.preview(0) == "#!/bin/bash\necho 1\n"
+
+    cached = list((tmp_path / "cache" / "slurmkit" / "jinja").glob("slurmkit_job_*.cache"))
+    assert len(cached) == (1 if enabled else 0)
+
+
 def test_job_generator_plan_and_dry_run_are_append_only(tmp_path):
     """Planning/dry-run should respect collection append mode without mutating it."""
     template = tmp_path / "train.job.j2"
@@ -421,6 +478,19 @@ class TestGenerateJobName:
         name = generate_job_name(params, pattern="val_{{ value }}")
         assert name == "val_0.001"
 
+    def test_precompiled_template(self):
+        """Test naming with a precompiled pattern template."""
+        template = Environment().from_string("{{ model }}_lr{{ lr }}")
+        name = generate_job_name({"model": "resnet", "lr": 0.01}, template=template)
+        assert name == "resnet_lr0.01"
+
+    def test_repeated_pattern_reuses_compiled_template(self):
+        """Test repeated patterns render per-call params from one compile."""
+        _compile_name_pattern.cache_clear()
+        names = [generate_job_name({"seed": seed}, pattern="run_{{ seed }}") for seed in range(3)]
+        assert names == ["run_0", "run_1", "run_2"]
+        assert _compile_name_pattern.cache_info().misses == 1
+
 
 class TestJobGenerator:
     """Tests for JobGenerator class."""
@@ -452,6 +522,40 @@ echo "Batch size: {{ batch_size }}"
         )
         assert generator.count_jobs() == 4
 
+    def test_generator_preview_out_of_range(self, template_dir):
+        """Test previewing past the last combination raises IndexError."""
+        generator = JobGenerator(
+            template_path=Path(template_dir) / "test.job.j2",
+            parameters={
+                "mode": "grid",
+                "values": {"learning_rate": [0.01, 0.1], "batch_size": [32]},
+            },
+            slurm_defaults={"partition": "gpu", "time": "1:00:00"},
+        )
+        assert "Learning rate: 0.1" in generator.preview(1)
+        with pytest.raises(IndexError, match=r"max 1"):
+            generator.preview(2)
+
+    def test_generators_share_template_until_file_changes(self, template_dir):
+        """Test generators reuse one compiled template until it is edited."""
+        template_path = Path(template_dir) / "test.job.j2"
+
+        def preview() -> str:
+            generator = JobGenerator(
+                template_path=template_path,
+                parameters={"mode": "grid", "values": {"learning_rate": [0.01], "batch_size": [32]}},
+                slurm_defaults={"partition": "gpu", "time": "1:00:00"},
+            )
+            return generator.preview(0)
+
+        first = preview()
+        assert first == preview()
+
+        template_path.write_text("#!/bin/bash\necho 'edited {{ learning_rate }}'\n")
+        stat = template_path.stat()
+        os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert "edited 0.01" in preview()
+
     def test_generator_list_names(self, template_dir):
         """Test listing job names."""
         generator = JobGenerator(
@@ -790,6 +894,11 @@ echo "Batch size: {{ batch_size }}"
             assert (Path(output_dir) / "job_lr0.01.job").exists()
             assert (Path(output_dir) / "job_lr0.1.job").exists()
 
+            # Each job owns its slurm_args; mutating one leaves the rest intact.
+            result[0]["slurm_args"]["time"] = "9:99"
+            assert result[1]["slurm_args"]["time"] == "1:00:00"
+            assert generator.slurm_defaults["time"] == "1:00:00"
+
     def test_generator_generate_one(self, template_dir):
         """Test generating a single script from explicit params + job name."""
         with tempfile.TemporaryDirectory() as output_dir:
@@ -853,3 +962,16 @@ class TestLoadJobSpec:
         """Test loading nonexistent file raises error."""
         with pytest.raises(FileNotFoundError):
             load_job_spec("/nonexistent/path.yaml")
+
+    def test_repeated_loads_are_independent_and_see_edits(self, tmp_path):
+        """Test cached loads return fresh copies and pick up file changes."""
+        spec_path = tmp_path / "spec.yaml"
+        spec_path.write_text("parameters:\n  mode: grid\n")
+
+        first = load_job_spec(spec_path)
+        first["parameters"]["mode"] = "list"
+        assert load_job_spec(spec_path)["parameters"]["mode"] == "grid"
+
+        spec_path.write_text("parameters:\n  mode: list\n")
+        os.utime(spec_path, ns=(0, 0))
+        assert load_job_spec(spec_path)["parameters"]["mode"] == "list"
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import threading
+from dataclasses import replace
+
+import requests
 import yaml
 
 from slurmkit.collections import Collection, CollectionManager
 from slurmkit.config import get_config
-from slurmkit.notifications import NotificationService
+from slurmkit import notifications
+from slurmkit.notifications import DeliveryResult, NotificationService
 from slurmkit.workflows.notifications import run_collection_final_notification, run_job_notification
 
 
@@ -110,3 +115,60 @@ def test_collection_final_notification_locks_nested_collection_path(tmp_path):
     assert (
         tmp_path / ".slurmkit" / "locks" / "collections" / "group" / "sub" / "run.lock"
     ).exists()
+
+
+def test_dispatch_sends_routes_concurrently_in_route_order(tmp_path, monkeypatch):
+    config_path = _write_config(tmp_path)
+    config = get_config(config_path=config_path, project_root=tmp_path, reload=True)
+    service = NotificationService(config=config)
+    route = service.resolve_routes(event="job_failed").routes[0]
+    routes = [route, replace(route, name="second")]
+
+    # Both sends must be in flight at once for the barrier to release.
+    barrier = threading.Barrier(len(routes), timeout=5)
+
+    def fake_send_json(route, payload, dry_run=False):
+        barrier.wait()
+        return DeliveryResult(route_name=route.name, route_type=route.route_type, success=True, attempts=1)
+
+    monkeypatch.setattr(service, "_send_json", fake_send_json)
+
+    results = service.dispatch(service.build_test_payload(), routes)
+
+    assert [result.route_name for result in results] == ["team", "second"]
+    assert all(result.success for result in results)
+
+
+def test_read_output_tail_reads_trailing_lines_across_blocks(tmp_path, monkeypatch):
+    monkeypatch.setattr(notifications, "_OUTPUT_TAIL_BLOCK_SIZE", 8)
+    output = tmp_path / "job.out"
+    output.write_text("".join(f"line {idx}\n" for idx in range(50)) + "partial", encoding="utf-8")
+
+    assert notifications._read_output_tail(output, 3) == "line 48\nline 49\npartial"
+    assert notifications._read_output_tail(output, 100).splitlines()[0] == "line 0"
+    assert notifications._read_output_tail(tmp_path / "missing.out", 3) is None
+
+
+def test_send_json_caps_retry_backoff_at_delivery_deadline(tmp_path, monkeypatch):
+    config_path = _write_config(tmp_path)
+    config = get_config(config_path=config_path, project_root=tmp_path, reload=True)
+    service = NotificationService(config=config)
+    route = replace(
+        service.resolve_routes(event="job_failed").routes[0],
+        timeout_seconds=0.01,
+        max_attempts=3,
+        backoff_seconds=60.0,
+    )
+
+    def failing_post(*args, **kwargs):
+        raise requests.ConnectionError("connection refused")
+
+    sleeps = []
+    monkeypatch.setattr(service._get_session(requests), "post", failing_post)
+    monkeypatch.setattr(notifications.time, "sleep", sleeps.append)
+
+    result = service._send_json(route, {"text": "hello"})
+
+    assert not result.success
+    assert "connection refused" in result.error
+    assert sleeps and all(delay <= 0.09 for delay in sleeps)